@@ -21,6 +21,7 @@ Usage::
 from __future__ import annotations
 
 import contextlib
+import copy
 import dataclasses
 import logging
 import os
@@ -43,6 +44,10 @@ _SETTINGS_FILENAME = "settings.yaml"
 # cannot clobber each other.
 _settings_lock = threading.Lock()
 
+# Parsed settings.yaml contents keyed by path, tagged with the file's
+# (mtime_ns, size) so external edits are picked up on the next load().
+_settings_cache: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
 
 # ---------------------------------------------------------------------------
 # Schema
@@ -177,17 +182,37 @@ def settings_path(settings: DistroPluginSettings) -> Path:
     return Path(settings.distro_home) / _SETTINGS_FILENAME
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or None if it cannot be stat'd."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load(settings: DistroPluginSettings) -> DistroSettings:
-    """Load distro settings from disk, returning defaults for missing values."""
+    """Load distro settings from disk, returning defaults for missing values.
+
+    The parsed YAML is cached in-process and only re-read when the file's
+    mtime or size changes, so repeated loads (and the load half of
+    :func:`update`) skip the YAML parse.
+    """
     path = settings_path(settings)
-    if not path.exists():
+    signature = _file_signature(path)
+    if signature is None:
         return DistroSettings()
 
     try:
-        raw = yaml.safe_load(path.read_text())
-        if not isinstance(raw, dict):
-            return DistroSettings()
-        return _nested_from_dict(DistroSettings, raw)
+        cached = _settings_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            raw = cached[1]
+        else:
+            raw = yaml.safe_load(path.read_text())
+            if not isinstance(raw, dict):
+                return DistroSettings()
+            _settings_cache[path] = (signature, raw)
+        return _nested_from_dict(DistroSettings, copy.deepcopy(raw))
     except (OSError, yaml.YAMLError):
         logger.warning("Failed to read distro settings from %s", path, exc_info=True)
         return DistroSettings()
@@ -202,7 +227,8 @@ def save(settings: DistroPluginSettings, distro: DistroSettings) -> Path:
     """
     path = settings_path(settings)
     path.parent.mkdir(parents=True, exist_ok=True)
-    content = yaml.dump(asdict(distro), default_flow_style=False, sort_keys=False)
+    data = asdict(distro)
+    content = yaml.dump(data, default_flow_style=False, sort_keys=False)
 
     fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".settings-", suffix=".yaml.tmp")
     try:
@@ -215,6 +241,10 @@ def save(settings: DistroPluginSettings, distro: DistroSettings) -> Path:
         with contextlib.suppress(OSError):
             os.unlink(tmp)
         raise
+
+    signature = _file_signature(path)
+    if signature is not None:
+        _settings_cache[path] = (signature, data)
     return path
 
 
@@ -15,6 +15,7 @@ from __future__ import annotations
 import contextlib
 import logging
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,9 @@ from distro_plugin.config import DistroPluginSettings
 
 logger = logging.getLogger(__name__)
 
+# A value wrapped in a matching pair of single or double quotes.
+_QUOTED_VALUE_RE = re.compile(r"""(["'])(.*)\1""", re.DOTALL)
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -268,29 +272,44 @@ def _settings_path(settings: DistroPluginSettings) -> Path:
 # ---------------------------------------------------------------------------
 
 
+# keys.env contents parsed by load_keys(), keyed by path and validated
+# against the file's (mtime_ns, size) so unchanged files are not re-parsed.
+_keys_cache: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
+
 def load_keys(settings: DistroPluginSettings) -> dict[str, str]:
     """Load keys.env if it exists, returning a dict of key=value pairs."""
     keys_path = _keys_path(settings)
-    if not keys_path.exists():
+    try:
+        st = keys_path.stat()
+    except OSError:
         return {}
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _keys_cache.get(keys_path)
+    if cached is not None and cached[0] == signature:
+        return dict(cached[1])
+
     result: dict[str, str] = {}
     try:
-        for raw_line in keys_path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            if key:
-                result[key] = value
+        with keys_path.open() as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if "=" not in line:
+                    continue
+                key, _, value = line.partition("=")
+                key = key.strip()
+                value = value.strip()
+                quoted = _QUOTED_VALUE_RE.fullmatch(value)
+                if quoted:
+                    value = quoted.group(2)
+                if key:
+                    result[key] = value
     except OSError:
-        pass
-    return result
+        return result
+    _keys_cache[keys_path] = (signature, result)
+    return dict(result)
 
 
 def persist_api_key(
@@ -337,6 +356,7 @@ def _write_raw_key(settings: DistroPluginSettings, key_name: str, value: str) ->
         lines.append(f'{key_name}="{value}"')
 
     keys_path.write_text("\n".join(lines) + "\n")
+    _keys_cache.pop(keys_path, None)
     with contextlib.suppress(OSError):
         keys_path.chmod(0o600)
 
@@ -510,41 +530,37 @@ def update_provider_model(
     return True
 
 
-def check_provider_status(
-    settings: DistroPluginSettings, provider_id: str
-) -> dict[str, bool]:
-    """Check whether a provider is fully configured across all three sources.
-
-    Returns a dict with:
-        has_key      — API key in ``os.environ`` or ``keys.env``
-        in_settings  — provider module listed in ``settings.yaml``
-        in_overlay   — provider include URI in overlay ``bundle.yaml``
-        configured   — all three are ``True``
-    """
-    from distro_plugin.overlay import get_includes
+def _configured_providers(settings: DistroPluginSettings) -> list[dict[str, Any]]:
+    """Return the ``config.providers`` list from settings.yaml (empty on error)."""
+    settings_path = _settings_path(settings)
+    if not settings_path.exists():
+        return []
+    try:
+        data = yaml.safe_load(settings_path.read_text()) or {}
+        return data.get("config", {}).get("providers", [])
+    except (yaml.YAMLError, OSError):
+        return []
 
-    provider = PROVIDERS[provider_id]
 
+def _status_from_sources(
+    provider: Provider,
+    keys: dict[str, str] | None,
+    providers_list: list[dict[str, Any]],
+    current_uris: set[str],
+) -> dict[str, bool]:
+    """Compute provider status from already-loaded config sources."""
     # 1. Key in env or keys.env (keyless providers always have_key=True)
     if not provider.needs_key:
         has_key = True
     else:
-        keys = load_keys(settings)
-        has_key = bool(os.environ.get(provider.env_var) or keys.get(provider.env_var))
+        has_key = bool(
+            os.environ.get(provider.env_var) or (keys or {}).get(provider.env_var)
+        )
 
     # 2. Provider module listed in settings.yaml
-    in_settings = False
-    settings_path = _settings_path(settings)
-    if settings_path.exists():
-        try:
-            data = yaml.safe_load(settings_path.read_text()) or {}
-            providers_list = data.get("config", {}).get("providers", [])
-            in_settings = _find_existing_entry(providers_list, provider) is not None
-        except (yaml.YAMLError, OSError):
-            pass
+    in_settings = _find_existing_entry(providers_list, provider) is not None
 
     # 3. Provider include URI in overlay bundle.yaml
-    current_uris = set(get_includes(settings))
     in_overlay = provider.include in current_uris
 
     return {
@@ -559,13 +575,45 @@ def check_provider_status(
     }
 
 
+def check_provider_status(
+    settings: DistroPluginSettings, provider_id: str
+) -> dict[str, bool]:
+    """Check whether a provider is fully configured across all three sources.
+
+    Returns a dict with:
+        has_key      — API key in ``os.environ`` or ``keys.env``
+        in_settings  — provider module listed in ``settings.yaml``
+        in_overlay   — provider include URI in overlay ``bundle.yaml``
+        configured   — all three are ``True``
+    """
+    from distro_plugin.overlay import get_includes
+
+    provider = PROVIDERS[provider_id]
+    return _status_from_sources(
+        provider,
+        load_keys(settings) if provider.needs_key else None,
+        _configured_providers(settings),
+        set(get_includes(settings)),
+    )
+
+
 def get_provider_catalog(
     settings: DistroPluginSettings,
 ) -> list[dict[str, object]]:
-    """Build the full provider catalog with configuration status."""
+    """Build the full provider catalog with configuration status.
+
+    keys.env, settings.yaml and the overlay are each read once and shared
+    across every provider, rather than re-read per catalog entry.
+    """
+    from distro_plugin.overlay import get_includes
+
+    keys = load_keys(settings)
+    providers_list = _configured_providers(settings)
+    current_uris = set(get_includes(settings))
+
     providers: list[dict[str, object]] = []
     for pid, p in PROVIDERS.items():
-        status = check_provider_status(settings, pid)
+        status = _status_from_sources(p, keys, providers_list, current_uris)
         providers.append(
             {
                 "id": pid,
@@ -126,3 +126,26 @@ def test_update_raises_on_invalid_section(tmp_path):
     s = _make_settings(tmp_path)
     with pytest.raises(AttributeError):
         update(s, section="nonexistent", some_key="value")
+
+
+def test_load_picks_up_external_edits(tmp_path):
+    """Cached settings are re-read when the file changes on disk."""
+    s = _make_settings(tmp_path)
+    save(s, DistroSettings(workspace_root="/first"))
+    assert load(s).workspace_root == "/first"
+
+    settings_path(s).write_text(yaml.dump({"workspace_root": "/edited/by/hand"}))
+    assert load(s).workspace_root == "/edited/by/hand"
+
+
+def test_load_returns_independent_copies(tmp_path):
+    """Mutating a loaded object does not leak into later loads."""
+    s = _make_settings(tmp_path)
+    save(s, DistroSettings(workspace_root="/stable"))
+    first = load(s)
+    first.workspace_root = "/mutated"
+    first.slack.hub_channel_name = "mutated"
+
+    second = load(s)
+    assert second.workspace_root == "/stable"
+    assert second.slack.hub_channel_name == "amplifier"
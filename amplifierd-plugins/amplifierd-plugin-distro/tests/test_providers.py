@@ -136,6 +136,25 @@ def test_load_keys_strips_quotes(settings):
     assert keys["PLAIN"] == "hello"
 
 
+def test_load_keys_picks_up_external_edits(settings):
+    """load_keys re-reads keys.env after it is rewritten outside the plugin."""
+    path = _keys_path(settings)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("FOO=one\n")
+    assert load_keys(settings) == {"FOO": "one"}
+    path.write_text("FOO=two\nBAR=three\n")
+    assert load_keys(settings) == {"FOO": "two", "BAR": "three"}
+
+
+def test_load_keys_returns_independent_copies(settings):
+    """Mutating a load_keys result does not affect later loads."""
+    path = _keys_path(settings)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("FOO=bar\n")
+    load_keys(settings)["FOO"] = "changed"
+    assert load_keys(settings) == {"FOO": "bar"}
+
+
 # -- add_provider_config -----------------------------------------------------
 
 
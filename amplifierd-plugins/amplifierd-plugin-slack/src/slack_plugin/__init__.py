@@ -42,6 +42,9 @@ _slack_aiohttp_session: Any = None
 # Lock to prevent concurrent reinitialize() calls.
 _reinitialize_lock = asyncio.Lock()
 
+# Setup page shipped with the plugin, resolved once at import.
+_SETUP_HTML = Path(__file__).parent / "static" / "slack-setup.html"
+
 
 def _get_state() -> dict[str, Any]:
     if not _state:
@@ -49,6 +52,22 @@ def _get_state() -> dict[str, Any]:
     return _state
 
 
+async def _end_active_sessions(
+    session_manager: SlackSessionManager, backend: SessionManagerAdapter
+) -> None:
+    """End every active mapped session on the backend, concurrently."""
+    mappings = session_manager.list_active()
+    results = await asyncio.gather(
+        *(backend.end_session(m.session_id) for m in mappings),
+        return_exceptions=True,
+    )
+    for mapping, result in zip(mappings, results, strict=True):
+        if isinstance(result, (RuntimeError, ValueError, ConnectionError, OSError)):
+            logger.error("Error ending session %s", mapping.session_id, exc_info=result)
+        elif isinstance(result, BaseException):
+            raise result
+
+
 async def _start_socket_mode(config: SlackConfig) -> None:
     """Start Socket Mode adapter; stores the adapter in _state. Cleans up on failure."""
     global _slack_aiohttp_session
@@ -98,16 +117,18 @@ async def reinitialize() -> dict[str, Any]:
         )
         existing_backend: SessionManagerAdapter | None = _state.get("backend")
         if existing_session_manager is not None and existing_backend is not None:
-            for mapping in existing_session_manager.list_active():
-                try:
-                    await existing_backend.end_session(mapping.session_id)
-                except (RuntimeError, ValueError, ConnectionError, OSError):
-                    logger.exception("Error ending session %s", mapping.session_id)
+            await _end_active_sessions(existing_session_manager, existing_backend)
+        if existing_session_manager is not None:
+            await asyncio.to_thread(existing_session_manager.flush)
 
         if _slack_aiohttp_session is not None and not _slack_aiohttp_session.closed:
             await _slack_aiohttp_session.close()
         _slack_aiohttp_session = None
 
+        existing_client: SlackClient | None = _state.get("client")
+        if existing_client is not None:
+            await existing_client.aclose()
+
         # Preserve the amplifierd state reference before clearing
         amplifierd_state = _state.get("_amplifierd_state")
 
@@ -255,16 +276,24 @@ def create_router(state: Any) -> APIRouter:
         if socket_adapter is not None:
             await socket_adapter.stop()
 
-        for mapping in session_manager.list_active():
-            try:
-                await backend.end_session(mapping.session_id)
-            except (RuntimeError, ValueError, ConnectionError, OSError):
-                logger.exception("Error ending session %s", mapping.session_id)
+        # reinitialize() may have replaced the objects built in this closure
+        active_session_manager: SlackSessionManager | None = _state.get(
+            "session_manager"
+        )
+        active_backend: SessionManagerAdapter | None = _state.get("backend")
+        if active_session_manager is not None and active_backend is not None:
+            await _end_active_sessions(active_session_manager, active_backend)
+        if active_session_manager is not None:
+            await asyncio.to_thread(active_session_manager.flush)
 
         if _slack_aiohttp_session is not None and not _slack_aiohttp_session.closed:
             await _slack_aiohttp_session.close()
         _slack_aiohttp_session = None
 
+        active_client: SlackClient | None = _state.get("client")
+        if active_client is not None:
+            await active_client.aclose()
+
         _state.clear()
         logger.info("Slack bridge shut down")
 
@@ -272,9 +301,10 @@ def create_router(state: Any) -> APIRouter:
 
     @router.get("/setup-ui", response_class=HTMLResponse)
     async def setup_page() -> HTMLResponse:
-        html_file = Path(__file__).parent / "static" / "slack-setup.html"
-        if html_file.exists():
-            return HTMLResponse(content=html_file.read_text())
+        try:
+            return HTMLResponse(content=_SETUP_HTML.read_text())
+        except OSError:
+            pass
         return HTMLResponse(
             content="<h1>Slack Setup</h1><p>slack-setup.html not found.</p>",
             status_code=500,
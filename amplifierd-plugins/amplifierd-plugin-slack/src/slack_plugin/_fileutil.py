@@ -18,7 +18,10 @@ def atomic_write(path: Path, content: str) -> None:
     state.  On success the file contains exactly *content*; on any failure
     the previous file (if any) is untouched.
     """
-    path.parent.mkdir(parents=True, exist_ok=True)
+    # Sessions are saved repeatedly into the same directory; a single stat
+    # is cheaper than mkdir's failed-create-then-check when it exists.
+    if not path.parent.is_dir():
+        path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as f:
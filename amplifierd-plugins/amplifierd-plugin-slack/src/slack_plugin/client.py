@@ -12,10 +12,13 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
-from typing import Any, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 from .models import SlackChannel
 
+if TYPE_CHECKING:
+    import httpx
+
 
 @runtime_checkable
 class SlackClient(Protocol):
@@ -57,6 +60,10 @@ class SlackClient(Protocol):
         """Get the bot's own user ID."""
         ...
 
+    async def aclose(self) -> None:
+        """Release any connections held by the client."""
+        ...
+
 
 @dataclass
 class SentMessage:
@@ -139,6 +146,9 @@ class MemorySlackClient:
     async def get_bot_user_id(self) -> str:
         return self.bot_user_id
 
+    async def aclose(self) -> None:
+        pass
+
 
 class HttpSlackClient:
     """Real Slack Web API client.
@@ -151,24 +161,39 @@ class HttpSlackClient:
     """
 
     def __init__(self, bot_token: str) -> None:
-        self._token = bot_token
         self._bot_user_id: str | None = None
         self._base_url = "https://slack.com/api"
+        self._headers = {"Authorization": f"Bearer {bot_token}"}
+        self._http: httpx.AsyncClient | None = None
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps the connection to slack.com alive across
+        calls instead of paying a fresh TLS handshake per API request.
+        """
+        if self._http is None or self._http.is_closed:
+            import httpx
+
+            self._http = httpx.AsyncClient(timeout=30.0, headers=self._headers)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
 
     async def _api_call(self, method: str, **kwargs: Any) -> dict[str, Any]:
         """Make a Slack API call."""
-        import httpx
-
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self._base_url}/{method}",
-                headers={"Authorization": f"Bearer {self._token}"},
-                json=kwargs,
-            )
-            data = response.json()
-            if not data.get("ok"):
-                raise RuntimeError(f"Slack API error: {data.get('error', 'unknown')}")
-            return data
+        response = await self._get_http().post(
+            f"{self._base_url}/{method}",
+            json=kwargs,
+        )
+        data = response.json()
+        if not data.get("ok"):
+            raise RuntimeError(f"Slack API error: {data.get('error', 'unknown')}")
+        return data
 
     async def post_message(
         self,
@@ -10,7 +10,9 @@ the session manager and discovery service.
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import logging
 import re
 from dataclasses import dataclass
@@ -24,6 +26,18 @@ from .sessions import SlackSessionManager
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=8)
+def _mention_pattern(bot_user_id: str) -> re.Pattern[str]:
+    """Compiled matcher for ``<@U123>`` / ``<@U123|name>`` mentions of the bot."""
+    return re.compile(rf"<@{re.escape(bot_user_id)}(?:\|[^>]*)?>")
+
+
+@functools.lru_cache(maxsize=8)
+def _bot_name_pattern(bot_name: str) -> re.Pattern[str]:
+    """Compiled matcher for a leading ``@botname`` / ``botname`` prefix."""
+    return re.compile(rf"^@?{re.escape(bot_name)}\b", re.IGNORECASE)
+
+
 @dataclass
 class CommandContext:
     """Context for a command invocation."""
@@ -69,6 +83,20 @@ class CommandHandler:
         "config": "Show bridge configuration",
     }
 
+    ALIASES: ClassVar[dict[str, str]] = {
+        "ls": "list",
+        "start": "new",
+        "create": "new",
+        "attach": "connect",
+        "join": "connect",
+        "disconnect": "end",
+        "info": "status",
+        "quit": "end",
+        "stop": "end",
+        "close": "end",
+        "?": "help",
+    }
+
     def __init__(
         self,
         session_manager: SlackSessionManager,
@@ -93,14 +121,11 @@ class CommandHandler:
         # Strip bot mention (handles both <@U123> and <@U123|displayname>)
         cleaned = text.strip()
         if bot_user_id:
-            cleaned = re.sub(
-                rf"<@{re.escape(bot_user_id)}(?:\|[^>]*)?>", "", cleaned
-            ).strip()
+            cleaned = _mention_pattern(bot_user_id).sub("", cleaned).strip()
 
         # Also strip the bot name
         if self._config.bot_name:
-            pattern = rf"^@?{re.escape(self._config.bot_name)}\b"
-            cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE).strip()
+            cleaned = _bot_name_pattern(self._config.bot_name).sub("", cleaned).strip()
 
         parts = cleaned.split()
         if not parts:
@@ -110,20 +135,7 @@ class CommandHandler:
         args = parts[1:]
 
         # Normalize aliases
-        aliases = {
-            "ls": "list",
-            "start": "new",
-            "create": "new",
-            "attach": "connect",
-            "join": "connect",
-            "disconnect": "end",
-            "info": "status",
-            "quit": "end",
-            "stop": "end",
-            "close": "end",
-            "?": "help",
-        }
-        command = aliases.get(command, command)
+        command = self.ALIASES.get(command, command)
 
         return command, args
 
@@ -150,8 +162,8 @@ class CommandHandler:
     async def cmd_list(self, args: list[str], ctx: CommandContext) -> CommandResult:
         """List recent Amplifier sessions from the filesystem."""
         project_filter = args[0] if args else None
-        sessions = self._discovery.list_sessions(
-            limit=15, project_filter=project_filter
+        sessions = await asyncio.to_thread(
+            self._discovery.list_sessions, limit=15, project_filter=project_filter
         )
 
         if not sessions:
@@ -171,7 +183,7 @@ class CommandHandler:
 
     async def cmd_projects(self, args: list[str], ctx: CommandContext) -> CommandResult:
         """List known projects."""
-        projects = self._discovery.list_projects()
+        projects = await asyncio.to_thread(self._discovery.list_projects)
 
         if not projects:
             return CommandResult(text="_No projects found._")
@@ -243,11 +255,13 @@ class CommandHandler:
         target_id = args[0]
 
         # Look up the session in discovery
-        session = self._discovery.get_session(target_id)
+        session = await asyncio.to_thread(self._discovery.get_session, target_id)
 
         # Also try prefix match
         if session is None:
-            all_sessions = self._discovery.list_sessions(limit=200)
+            all_sessions = await asyncio.to_thread(
+                self._discovery.list_sessions, limit=200
+            )
             matches = [s for s in all_sessions if s.session_id.startswith(target_id)]
             if len(matches) == 1:
                 session = matches[0]
@@ -356,7 +370,7 @@ class CommandHandler:
             with contextlib.suppress(ValueError):
                 limit = int(args[0])
 
-        sessions = self._discovery.list_sessions(limit=limit)
+        sessions = await asyncio.to_thread(self._discovery.list_sessions, limit=limit)
         if not sessions:
             return CommandResult(text="_No local sessions found._")
 
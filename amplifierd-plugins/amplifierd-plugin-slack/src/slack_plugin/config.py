@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import logging
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -24,29 +25,33 @@ _DEFAULT_AMPLIFIER_HOME = "~/.amplifier"
 _KEYS_FILENAME = "keys.env"
 
 
+# One KEY=VALUE line of keys.env: leading/trailing blanks are ignored,
+# comment lines never match, and a value wrapped in matching quotes is
+# captured without them.
+_KEY_LINE_RE = re.compile(
+    r"""^[^\S\n]*([^\s#=][^=\n]*?)[^\S\n]*=[^\S\n]*(?:(["'])(.*)\2|(.*?))[^\S\n]*$""",
+    re.MULTILINE,
+)
+
+
+def _parse_keys(text: str) -> dict[str, Any]:
+    """Parse .env-format text into a dict of key=value pairs."""
+    return {
+        m.group(1): m.group(3) if m.group(2) else m.group(4)
+        for m in _KEY_LINE_RE.finditer(text)
+    }
+
+
 def _load_keys(amplifier_home: str = _DEFAULT_AMPLIFIER_HOME) -> dict[str, Any]:
     """Load keys.env if it exists (.env format)."""
     path = Path(amplifier_home).expanduser() / _KEYS_FILENAME
     if not path.exists():
         return {}
-    result: dict[str, Any] = {}
     try:
-        for raw_line in path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            if key:
-                result[key] = value
+        return _parse_keys(path.read_text())
     except OSError:
         logger.warning("Failed to read keys.env", exc_info=True)
-    return result
+    return {}
 
 
 def _env_str(env_key: str, fallback: str) -> str:
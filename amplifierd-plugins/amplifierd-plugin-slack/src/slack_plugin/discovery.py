@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -25,9 +26,10 @@ from pathlib import Path
 logger = logging.getLogger(__name__)
 
 METADATA_FILENAME = "metadata.json"
+TRANSCRIPT_FILENAME = "transcript.jsonl"
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredSession:
     """A session found on the local filesystem."""
 
@@ -40,7 +42,7 @@ class DiscoveredSession:
     description: str = ""  # From metadata.json
 
 
-@dataclass
+@dataclass(slots=True)
 class DiscoveredProject:
     """A project found on the local filesystem."""
 
@@ -61,6 +63,9 @@ class AmplifierDiscovery:
     def __init__(self, amplifier_home: str = "~/.amplifier") -> None:
         self._home = Path(amplifier_home).expanduser()
         self._projects_dir = self._home / "projects"
+        # session_id -> (project dir name, session dir), filled by get_session()
+        # so repeated lookups (connect, reconnect) skip the projects scan.
+        self._session_index: dict[str, tuple[str, Path]] = {}
 
     @property
     def projects_dir(self) -> Path:
@@ -80,50 +85,34 @@ class AmplifierDiscovery:
         Returns:
             Sessions sorted by most recent first.
         """
-        if not self._projects_dir.exists():
-            return []
-
         sessions: list[DiscoveredSession] = []
 
-        for project_dir in self._projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            project_path = self._decode_project_path(project_dir.name)
+        for project_entry in self._scan_dirs(self._projects_dir):
+            project_path = self._decode_project_path(project_entry.name)
             project_name = self._extract_project_name(project_path)
 
             if project_filter and project_name != project_filter:
                 continue
 
-            sessions_dir = project_dir / "sessions"
-            if not sessions_dir.exists():
-                # Some projects store sessions directly
-                sessions_dir = project_dir
-
-            for session_dir in sessions_dir.iterdir():
-                if not session_dir.is_dir():
-                    continue
-
-                session_id = session_dir.name
+            for session_entry in self._scan_session_dirs(project_entry.path):
+                session_id = session_entry.name
 
                 # Skip sub-sessions (contain _ in the UUID)
                 if "_" in session_id:
                     continue
 
                 # Require transcript.jsonl
-                transcript = session_dir / "transcript.jsonl"
-                if not transcript.exists():
-                    continue
-
                 try:
-                    mtime = transcript.stat().st_mtime
+                    mtime = os.stat(
+                        os.path.join(session_entry.path, TRANSCRIPT_FILENAME)
+                    ).st_mtime
                 except OSError:
                     continue
 
                 # Load metadata if available
                 name = ""
                 description = ""
-                metadata_file = session_dir / METADATA_FILENAME
+                metadata_file = Path(session_entry.path, METADATA_FILENAME)
                 if metadata_file.exists():
                     try:
                         meta = json.loads(metadata_file.read_text())
@@ -154,89 +143,106 @@ class AmplifierDiscovery:
     def get_session(self, session_id: str) -> DiscoveredSession | None:
         """Find a specific session by ID.
 
-        Searches across all projects for the given session UUID.
+        Searches across all projects for the given session UUID. The
+        location of a found session is remembered, so later lookups for
+        the same ID only stat its transcript instead of rescanning.
         """
-        if not self._projects_dir.exists():
+        located = self._session_index.get(session_id)
+        mtime: float | None = None
+        if located is not None:
+            try:
+                mtime = (located[1] / TRANSCRIPT_FILENAME).stat().st_mtime
+            except OSError:
+                pass  # Moved or deleted since it was indexed; locate it again
+        if mtime is None:
+            located = self._locate_session(session_id)
+            if located is None:
+                self._session_index.pop(session_id, None)
+                return None
+            self._session_index[session_id] = located
+            try:
+                mtime = (located[1] / TRANSCRIPT_FILENAME).stat().st_mtime
+            except OSError:
+                return None
+
+        project_dir_name, session_dir = located
+        project_path = self._decode_project_path(project_dir_name)
+        project_name = self._extract_project_name(project_path)
+        dt = datetime.fromtimestamp(mtime, tz=UTC)
+
+        name = ""
+        description = ""
+        metadata_file = session_dir / METADATA_FILENAME
+        if metadata_file.exists():
+            try:
+                meta = json.loads(metadata_file.read_text())
+                name = meta.get("name", "")
+                description = meta.get("description", "")
+            except (json.JSONDecodeError, OSError):
+                pass
+
+        return DiscoveredSession(
+            session_id=session_id,
+            project=project_name,
+            project_path=project_path,
+            mtime=mtime,
+            date_str=dt.strftime("%m/%d %H:%M"),
+            name=name,
+            description=description,
+        )
+
+    def _locate_session(self, session_id: str) -> tuple[str, Path] | None:
+        """Scan the projects dir for *session_id*.
+
+        Uses ``os.scandir`` so the directory check comes from the cached
+        ``DirEntry`` type, and probes each candidate transcript directly
+        rather than stat-ing the session directory first.
+        """
+        try:
+            with os.scandir(self._projects_dir) as it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+                    # Check both sessions/ subdirectory and direct layout
+                    for session_dir in (
+                        Path(entry.path, "sessions", session_id),
+                        Path(entry.path, session_id),
+                    ):
+                        if os.path.isfile(session_dir / TRANSCRIPT_FILENAME):
+                            return entry.name, session_dir
+        except OSError:
             return None
-
-        for project_dir in self._projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            # Check both direct and sessions/ subdirectory
-            for sessions_dir in [project_dir / "sessions", project_dir]:
-                session_dir = sessions_dir / session_id
-                if session_dir.exists() and (session_dir / "transcript.jsonl").exists():
-                    project_path = self._decode_project_path(project_dir.name)
-                    project_name = self._extract_project_name(project_path)
-
-                    mtime = (session_dir / "transcript.jsonl").stat().st_mtime
-                    dt = datetime.fromtimestamp(mtime, tz=UTC)
-
-                    name = ""
-                    description = ""
-                    metadata_file = session_dir / METADATA_FILENAME
-                    if metadata_file.exists():
-                        try:
-                            meta = json.loads(metadata_file.read_text())
-                            name = meta.get("name", "")
-                            description = meta.get("description", "")
-                        except (json.JSONDecodeError, OSError):
-                            pass
-
-                    return DiscoveredSession(
-                        session_id=session_id,
-                        project=project_name,
-                        project_path=project_path,
-                        mtime=mtime,
-                        date_str=dt.strftime("%m/%d %H:%M"),
-                        name=name,
-                        description=description,
-                    )
         return None
 
     def list_projects(self) -> list[DiscoveredProject]:
         """List all known projects with session counts."""
-        if not self._projects_dir.exists():
-            return []
-
         projects: list[DiscoveredProject] = []
 
-        for project_dir in self._projects_dir.iterdir():
-            if not project_dir.is_dir():
-                continue
-
-            project_path = self._decode_project_path(project_dir.name)
+        for project_entry in self._scan_dirs(self._projects_dir):
+            project_path = self._decode_project_path(project_entry.name)
             project_name = self._extract_project_name(project_path)
 
             # Count sessions
-            sessions_dir = project_dir / "sessions"
-            if not sessions_dir.exists():
-                sessions_dir = project_dir
-
             session_count = 0
             latest_mtime = 0.0
 
-            for session_dir in sessions_dir.iterdir():
-                if not session_dir.is_dir():
+            for session_entry in self._scan_session_dirs(project_entry.path):
+                if "_" in session_entry.name:
                     continue
-                if "_" in session_dir.name:
+                try:
+                    mt = os.stat(
+                        os.path.join(session_entry.path, TRANSCRIPT_FILENAME)
+                    ).st_mtime
+                except OSError:
                     continue
-                transcript = session_dir / "transcript.jsonl"
-                if transcript.exists():
-                    session_count += 1
-                    try:
-                        mt = transcript.stat().st_mtime
-                        if mt > latest_mtime:
-                            latest_mtime = mt
-                    except OSError:
-                        pass
+                session_count += 1
+                latest_mtime = max(latest_mtime, mt)
 
             if session_count > 0:
                 dt = datetime.fromtimestamp(latest_mtime, tz=UTC)
                 projects.append(
                     DiscoveredProject(
-                        project_id=project_dir.name,
+                        project_id=project_entry.name,
                         project_name=project_name,
                         project_path=project_path,
                         session_count=session_count,
@@ -247,6 +253,28 @@ class AmplifierDiscovery:
         projects.sort(key=lambda p: p.project_name)
         return projects
 
+    @staticmethod
+    def _scan_dirs(path: str | os.PathLike[str]) -> list[os.DirEntry[str]]:
+        """Return the subdirectory entries of *path* (empty if unreadable).
+
+        ``os.scandir`` carries the entry type from the directory read, so
+        filtering to directories costs no extra ``stat`` per child.
+        """
+        try:
+            with os.scandir(path) as it:
+                return [entry for entry in it if entry.is_dir()]
+        except OSError:
+            return []
+
+    @classmethod
+    def _scan_session_dirs(cls, project_dir: str) -> list[os.DirEntry[str]]:
+        """Return session directory entries for a project directory."""
+        sessions_dir = os.path.join(project_dir, "sessions")
+        if not os.path.isdir(sessions_dir):
+            # Some projects store sessions directly
+            sessions_dir = project_dir
+        return cls._scan_dirs(sessions_dir)
+
     @staticmethod
     def _decode_project_path(dir_name: str) -> str:
         """Decode an encoded project directory name back to a path.
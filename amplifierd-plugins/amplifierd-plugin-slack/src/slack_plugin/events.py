@@ -17,7 +17,7 @@ import logging
 import re as _re
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from .client import SlackClient
 from .commands import CommandContext, CommandHandler
@@ -31,6 +31,12 @@ logger = logging.getLogger(__name__)
 # Max file size for Slack file downloads (50 MB)
 _MAX_FILE_SIZE = 50 * 1024 * 1024
 
+# Message subtypes that are edits/deletes rather than new user input
+_IGNORED_MESSAGE_SUBTYPES = frozenset({"message_changed", "message_deleted"})
+
+# Reactions that ask the bot to re-run the original prompt
+_REGENERATE_REACTIONS = frozenset({"repeat", "arrows_counterclockwise"})
+
 
 class SlackEventHandler:
     """Handles incoming Slack events.
@@ -40,6 +46,13 @@ class SlackEventHandler:
     the command handler or the session manager.
     """
 
+    # Slack event type -> handler method name
+    EVENT_HANDLERS: ClassVar[dict[str, str]] = {
+        "message": "_handle_message",
+        "app_mention": "_handle_app_mention",
+        "reaction_added": "_handle_reaction",
+    }
+
     def __init__(
         self,
         client: SlackClient,
@@ -129,14 +142,11 @@ class SlackEventHandler:
         """Dispatch a Slack event to the appropriate handler."""
         event_type = event.get("type")
 
-        if event_type == "message":
-            await self._handle_message(event)
-        elif event_type == "app_mention":
-            await self._handle_app_mention(event)
-        elif event_type == "reaction_added":
-            await self._handle_reaction(event)
-        else:
+        handler_name = self.EVENT_HANDLERS.get(event_type or "")
+        if handler_name is None:
             logger.debug(f"Ignoring event type: {event_type}")
+            return
+        await getattr(self, handler_name)(event)
 
     async def _handle_message(self, event: dict[str, Any]) -> None:
         """Handle a message event.
@@ -151,7 +161,7 @@ class SlackEventHandler:
             return
 
         # Ignore message edits and deletes
-        if event.get("subtype") in ("message_changed", "message_deleted"):
+        if event.get("subtype") in _IGNORED_MESSAGE_SUBTYPES:
             return
 
         bot_user_id = await self.get_bot_user_id()
@@ -178,10 +188,9 @@ class SlackEventHandler:
 
         # Check if this is a command (mentions bot or starts with bot name)
         # Slack sends mentions as <@U123> or <@U123|displayname> - match both
-        is_command = (
-            f"<@{bot_user_id}" in text
-            or text.lower().startswith(f"@{self._config.bot_name}")
-            or text.lower().startswith(f"{self._config.bot_name} ")
+        bot_name = self._config.bot_name
+        is_command = f"<@{bot_user_id}" in text or text.lower().startswith(
+            (f"@{bot_name}", f"{bot_name} ")
         )
 
         if is_command:
@@ -558,7 +567,7 @@ class SlackEventHandler:
             return
 
         # Regenerate: re-execute original prompt
-        if reaction in ("repeat", "arrows_counterclockwise"):
+        if reaction in _REGENERATE_REACTIONS:
             prompt_info = self._message_prompts.get(message_ts)
             if prompt_info is None:
                 logger.debug("No tracked prompt for message %s", message_ts)
@@ -19,6 +19,18 @@ from typing import Any
 # Placeholder prefix unlikely to appear in real text
 _PH = "\x00PH"
 
+# Patterns used on every converted message, compiled once at import.
+_FENCED_CODE_RE = re.compile(r"```[\s\S]*?```")
+_INLINE_CODE_RE = re.compile(r"`[^`\n]+`")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_HEADER_RE = re.compile(r"^#{1,6}\s+(.+)$", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_STRIKE_RE = re.compile(r"~~(.+?)~~")
+_BULLET_RE = re.compile(r"^(\s*)[-*]\s+", re.MULTILINE)
+_CODE_LANG_RE = re.compile(r"```\w*\n")
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|[\s\-:|]+\|\s*$")
+_PLACEHOLDER_RE = re.compile(rf"{_PH}(\d+){_PH}")
+
 
 def _protect_regions(text: str) -> tuple[str, list[str]]:
     """Replace code blocks and inline code with numbered placeholders.
@@ -33,17 +45,23 @@ def _protect_regions(text: str) -> tuple[str, list[str]]:
         return f"{_PH}{idx}{_PH}"
 
     # Fenced code blocks first (greedy across lines)
-    text = re.sub(r"```[\s\S]*?```", _stash, text)
+    text = _FENCED_CODE_RE.sub(_stash, text)
     # Then inline code (single backtick)
-    text = re.sub(r"`[^`\n]+`", _stash, text)
+    text = _INLINE_CODE_RE.sub(_stash, text)
     return text, regions
 
 
 def _restore_regions(text: str, regions: list[str]) -> str:
     """Put the originals back in place of placeholders."""
-    for i, original in enumerate(regions):
-        text = text.replace(f"{_PH}{i}{_PH}", original)
-    return text
+    if not regions:
+        return text
+
+    def _restore(m: re.Match[str]) -> str:
+        idx = int(m.group(1))
+        # Placeholder-like text with no stashed region is left as is.
+        return regions[idx] if idx < len(regions) else m.group(0)
+
+    return _PLACEHOLDER_RE.sub(_restore, text)
 
 
 class SlackFormatter:
@@ -77,32 +95,27 @@ class SlackFormatter:
         # --- Standard Markdown → Slack mrkdwn ---
 
         # Convert links: [text](url) -> <url|text>
-        result = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"<\2|\1>", result)
+        result = _LINK_RE.sub(r"<\2|\1>", result)
 
         # Convert headers: # text -> *text*
-        result = re.sub(r"^#{1,6}\s+(.+)$", r"*\1*", result, flags=re.MULTILINE)
+        result = _HEADER_RE.sub(r"*\1*", result)
 
         # Convert bold: **text** -> *text* (must come before italic)
-        result = re.sub(r"\*\*(.+?)\*\*", r"*\1*", result)
+        result = _BOLD_RE.sub(r"*\1*", result)
 
         # Convert strikethrough: ~~text~~ -> ~text~
-        result = re.sub(r"~~(.+?)~~", r"~\1~", result)
+        result = _STRIKE_RE.sub(r"~\1~", result)
 
         # Bullet lists: - item -> bullet item (Slack renders these better)
         # Use a callable replacement to avoid regex escape issues with
         # the unicode bullet character in raw strings.
-        result = re.sub(
-            r"^(\s*)[-*]\s+",
-            lambda m: m.group(1) + "\u2022 ",
-            result,
-            flags=re.MULTILINE,
-        )
+        result = _BULLET_RE.sub(lambda m: m.group(1) + "\u2022 ", result)
 
         # --- Restore protected regions ---
         result = _restore_regions(result, regions)
 
         # Strip language hints from fenced code blocks (after restore)
-        result = re.sub(r"```\w*\n", "```\n", result)
+        result = _CODE_LANG_RE.sub("```\n", result)
 
         return result
 
@@ -131,7 +144,7 @@ class SlackFormatter:
             if (
                 "|" in line
                 and i + 1 < len(lines)
-                and re.match(r"^\s*\|[\s\-:|]+\|\s*$", lines[i + 1])
+                and _TABLE_SEPARATOR_RE.match(lines[i + 1])
             ):
                 headers = [h.strip() for h in line.strip().strip("|").split("|")]
                 i += 2  # skip header + separator
@@ -19,7 +19,7 @@ class ChannelType(StrEnum):
     SESSION = "session"  # A breakout channel for a specific session
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackUser:
     """A Slack user."""
 
@@ -28,7 +28,7 @@ class SlackUser:
     display_name: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackChannel:
     """A Slack channel."""
 
@@ -39,7 +39,7 @@ class SlackChannel:
     created_at: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackMessage:
     """A message from Slack."""
 
@@ -63,7 +63,7 @@ class SlackMessage:
         return self.channel_id
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMapping:
     """Maps a Slack conversation context to an Amplifier session.
 
@@ -6,13 +6,17 @@ and Amplifier session IDs, and delegates message handling to the backend adapter
 
 Persistence:
 - Session mappings are persisted to a JSON file so they survive restarts.
-- Mappings are loaded on startup and saved on every change.
+- Mappings are loaded on startup and saved on every change. Activity
+  timestamp bumps alone are throttled (see _LAST_ACTIVE_SAVE_INTERVAL)
+  and written out by the next save or flush().
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -23,6 +27,9 @@ from .models import SessionMapping, SlackChannel, SlackMessage
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between saves triggered only by a last_active bump.
+_LAST_ACTIVE_SAVE_INTERVAL = 30.0
+
 
 class SlackSessionManager:
     """Manages Slack-to-Amplifier session mappings.
@@ -48,8 +55,16 @@ class SlackSessionManager:
         self._config = config
         self._persistence_path = persistence_path
         self._mappings: dict[str, SessionMapping] = {}
+        # Active subset of _mappings. Ended mappings stay in the table (and
+        # on disk), so listing active sessions reads this instead of scanning.
+        self._active: dict[str, SessionMapping] = {}
         # Track which channels are breakout channels
         self._breakout_channels: dict[str, str] = {}  # channel_id -> session_id
+        # Unsaved last_active bumps, and when mappings were last written
+        self._dirty = False
+        self._last_save = 0.0
+        # Single worker so queued writes land on disk in submission order
+        self._writer: ThreadPoolExecutor | None = None
         # Load persisted sessions on startup
         self._load_sessions()
 
@@ -72,8 +87,7 @@ class SlackSessionManager:
                     is_active=entry.get("is_active", True),
                     working_dir=entry.get("working_dir", ""),
                 )
-                key = mapping.conversation_key
-                self._mappings[key] = mapping
+                self._put_mapping(mapping.conversation_key, mapping)
             logger.info(
                 f"Loaded {len(data)} session mappings from {self._persistence_path}"
             )
@@ -81,31 +95,93 @@ class SlackSessionManager:
             logger.warning("Failed to load session mappings", exc_info=True)
 
     def _save_sessions(self) -> None:
-        """Save session mappings to the persistence file."""
+        """Save session mappings to the persistence file.
+
+        The mapping table is snapshotted here, on the caller's thread; the
+        atomic write and fsync run on a background writer so the event loop
+        is not blocked on disk I/O.
+        """
         if self._persistence_path is None:
             return
+        data = [
+            {
+                "session_id": m.session_id,
+                "channel_id": m.channel_id,
+                "thread_ts": m.thread_ts,
+                "project_id": m.project_id,
+                "description": m.description,
+                "created_by": m.created_by,
+                "created_at": m.created_at,
+                "last_active": m.last_active,
+                "is_active": m.is_active,
+                "working_dir": m.working_dir,
+            }
+            for m in self._mappings.values()
+        ]
+        content = json.dumps(data, separators=(",", ":"))
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="slack-sessions-writer"
+            )
+        self._writer.submit(self._write_sessions, self._persistence_path, content)
+        self._dirty = False
+        self._last_save = time.monotonic()
+
+    @staticmethod
+    def _write_sessions(path: Path, content: str) -> None:
+        """Write a serialized mapping table to disk (runs on the writer)."""
+        from ._fileutil import atomic_write
+
+        # Nothing waits on the writer's futures, so any failure is logged here
         try:
-            self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
-            data = [
-                {
-                    "session_id": m.session_id,
-                    "channel_id": m.channel_id,
-                    "thread_ts": m.thread_ts,
-                    "project_id": m.project_id,
-                    "description": m.description,
-                    "created_by": m.created_by,
-                    "created_at": m.created_at,
-                    "last_active": m.last_active,
-                    "is_active": m.is_active,
-                    "working_dir": m.working_dir,
-                }
-                for m in self._mappings.values()
-            ]
-            from ._fileutil import atomic_write
-
-            atomic_write(self._persistence_path, json.dumps(data, indent=2))
+            atomic_write(path, content)
         except OSError:
             logger.warning("Failed to save session mappings", exc_info=True)
+        except Exception:
+            logger.exception("Unexpected error saving session mappings")
+
+    def _put_mapping(self, key: str, mapping: SessionMapping) -> None:
+        """Store a mapping under *key*, keeping the active index in sync."""
+        self._mappings[key] = mapping
+        if mapping.is_active:
+            self._active[key] = mapping
+        else:
+            self._active.pop(key, None)
+
+    def _pop_mapping(self, key: str) -> SessionMapping | None:
+        """Remove and return the mapping stored under *key*."""
+        self._active.pop(key, None)
+        return self._mappings.pop(key, None)
+
+    def _deactivate(self, mapping: SessionMapping) -> None:
+        """Mark a mapping inactive and drop it from the active index.
+
+        The index entry is only removed if it still refers to *mapping*; a
+        stale mapping must not evict a newer session on the same key.
+        """
+        mapping.is_active = False
+        key = mapping.conversation_key
+        if self._active.get(key) is mapping:
+            del self._active[key]
+
+    def _touch(self, mapping: SessionMapping) -> None:
+        """Bump a mapping's last_active, saving at most once per interval."""
+        mapping.last_active = datetime.now(UTC).isoformat()
+        if time.monotonic() - self._last_save >= _LAST_ACTIVE_SAVE_INTERVAL:
+            self._save_sessions()
+        else:
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write out pending last_active updates and wait for queued writes.
+
+        The background writer is released; a later save starts a new one.
+        """
+        if self._dirty:
+            self._save_sessions()
+        if self._writer is not None:
+            self._writer.shutdown(wait=True)
+            self._writer = None
 
     @property
     def mappings(self) -> dict[str, SessionMapping]:
@@ -174,7 +250,7 @@ class SlackSessionManager:
             last_active=now,
             working_dir=info.working_dir,
         )
-        self._mappings[key] = mapping
+        self._put_mapping(key, mapping)
         self._save_sessions()
         logger.info(f"Created session {info.session_id} mapped to {key}")
         return mapping
@@ -219,7 +295,7 @@ class SlackSessionManager:
             working_dir=effective_working_dir,
         )
 
-        self._mappings[key] = mapping
+        self._put_mapping(key, mapping)
         self._save_sessions()
         logger.info(
             "Connected session %s (in %s) mapped to %s",
@@ -237,8 +313,7 @@ class SlackSessionManager:
         if mapping is None or not mapping.is_active:
             return None
 
-        mapping.last_active = datetime.now(UTC).isoformat()
-        self._save_sessions()
+        self._touch(mapping)
 
         prompt = text_override if text_override is not None else message.text
         try:
@@ -247,7 +322,7 @@ class SlackSessionManager:
             )
             return response
         except ValueError:
-            mapping.is_active = False
+            self._deactivate(mapping)
             self._save_sessions()
             logger.warning(
                 "Session %s is dead, deactivated mapping for %s",
@@ -265,7 +340,7 @@ class SlackSessionManager:
         if mapping is None:
             return False
 
-        mapping.is_active = False
+        self._deactivate(mapping)
         self._save_sessions()
         try:
             await self._backend.end_session(mapping.session_id)
@@ -306,12 +381,11 @@ class SlackSessionManager:
 
         new_channel = await self._client.create_channel(channel_name, topic=topic)
 
-        old_key = mapping.conversation_key
-        self._mappings.pop(old_key, None)
+        self._pop_mapping(mapping.conversation_key)
 
         mapping.channel_id = new_channel.id
         mapping.thread_ts = None
-        self._mappings[new_channel.id] = mapping
+        self._put_mapping(new_channel.id, mapping)
         self._breakout_channels[new_channel.id] = mapping.session_id
         self._save_sessions()
 
@@ -325,19 +399,15 @@ class SlackSessionManager:
 
     def list_active(self) -> list[SessionMapping]:
         """List all active session mappings."""
-        return [m for m in self._mappings.values() if m.is_active]
+        return list(self._active.values())
 
     def list_user_sessions(self, user_id: str) -> list[SessionMapping]:
         """List active sessions for a specific user."""
-        return [
-            m
-            for m in self._mappings.values()
-            if m.created_by == user_id and m.is_active
-        ]
+        return [m for m in self._active.values() if m.created_by == user_id]
 
     def rekey_mapping(self, channel_id: str, thread_ts: str) -> None:
         """Re-key a bare channel mapping to a composite channel_id:thread_ts key."""
-        mapping = self._mappings.pop(channel_id, None)
+        mapping = self._pop_mapping(channel_id)
         if mapping is None:
             logger.warning(
                 f"rekey_mapping: no bare-channel mapping found for {channel_id!r}"
@@ -346,7 +416,7 @@ class SlackSessionManager:
 
         mapping.thread_ts = thread_ts
         new_key = f"{channel_id}:{thread_ts}"
-        self._mappings[new_key] = mapping
+        self._put_mapping(new_key, mapping)
         self._save_sessions()
         logger.info(
             f"Re-keyed session {mapping.session_id} from {channel_id!r} to {new_key!r}"
@@ -31,6 +31,8 @@ import yaml
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from .config import _parse_keys
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/setup", tags=["slack-setup"])
@@ -140,24 +142,11 @@ def load_keys() -> dict[str, Any]:
     path = _keys_path()
     if not path.exists():
         return {}
-    result: dict[str, Any] = {}
     try:
-        for raw_line in path.read_text().splitlines():
-            line = raw_line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            key = key.strip()
-            value = value.strip()
-            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
-                value = value[1:-1]
-            if key:
-                result[key] = value
+        return _parse_keys(path.read_text())
     except OSError:
         logger.warning("Failed to read keys.env", exc_info=True)
-    return result
+    return {}
 
 
 def _save_keys(updates: dict[str, str]) -> None:
@@ -412,9 +401,7 @@ async def configure(req: ConfigureRequest) -> dict[str, Any]:
         "SLACK_HUB_CHANNEL_NAME": req.hub_channel_name,
         "SLACK_SOCKET_MODE": "true" if req.socket_mode else "false",
     }
-    for key, value in env_map.items():
-        if value:
-            os.environ[key] = value
+    os.environ.update({key: value for key, value in env_map.items() if value})
 
     return {
         "status": "saved",
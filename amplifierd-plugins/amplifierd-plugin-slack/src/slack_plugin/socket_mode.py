@@ -14,9 +14,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import functools
 import json
 import logging
 import time
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
@@ -47,6 +49,15 @@ _HEALTH_CHECK_CYCLES = 8  # check auth.test every N watchdog cycles (~2 min)
 _DEDUP_WINDOW_SECS = 120.0
 _DEDUP_MAX_SIZE = 200
 
+# WebSocket message types that mean the server side has gone away
+_CLOSE_MSG_TYPES = frozenset(
+    {
+        aiohttp.WSMsgType.CLOSE,
+        aiohttp.WSMsgType.CLOSING,
+        aiohttp.WSMsgType.CLOSED,
+    }
+)
+
 
 class SocketModeAdapter:
     """Bridges Slack Socket Mode events to our SlackEventHandler.
@@ -74,8 +85,8 @@ class SocketModeAdapter:
         self._bot_user_id: str | None = None
         # Dedup: track recently-seen message timestamps to avoid processing
         # both app_mention and message events for the same @mention.
-        # Maps "channel:ts" -> monotonic time when first seen.
-        self._seen_events: dict[str, float] = {}
+        # Maps "channel:ts" -> monotonic time when first seen, oldest first.
+        self._seen_events: OrderedDict[str, float] = OrderedDict()
         # Watchdog state
         self._watchdog_task: asyncio.Task[None] | None = None
         self._last_wall: float = 0.0
@@ -83,6 +94,8 @@ class SocketModeAdapter:
         # Pending background event tasks — tracked so we can drain on stop()
         # and log exceptions via done callbacks.
         self._pending_tasks: set[asyncio.Task] = set()
+        # Shared client for Web API calls (auth.test, apps.connections.open)
+        self._http: httpx.AsyncClient | None = None
 
     async def start(self) -> None:
         """Start the Socket Mode connection in the background."""
@@ -100,37 +113,46 @@ class SocketModeAdapter:
         self._watchdog_task = asyncio.create_task(self._watchdog_loop())
         logger.info("Socket Mode adapter started")
 
+    def _get_http(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reconnects and watchdog health checks reuse the pooled connection
+        to slack.com instead of opening a new one per call.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(timeout=30.0)
+        return self._http
+
     async def _resolve_bot_id(self) -> str | None:
         """Get the bot's own user ID via auth.test."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.post(
-                    "https://slack.com/api/auth.test",
-                    headers={"Authorization": f"Bearer {self._config.bot_token}"},
-                )
-                data = resp.json()
-                if data.get("ok"):
-                    bot_id = data.get("user_id")
-                    logger.info(f"Bot user ID: {bot_id}")
-                    return bot_id
+            resp = await self._get_http().post(
+                "https://slack.com/api/auth.test",
+                headers={"Authorization": f"Bearer {self._config.bot_token}"},
+            )
+            data = resp.json()
+            if data.get("ok"):
+                bot_id = data.get("user_id")
+                logger.info(f"Bot user ID: {bot_id}")
+                return bot_id
         except (httpx.HTTPError, KeyError, ValueError):
             logger.exception("Failed to resolve bot user ID")
         return None
 
     async def _get_ws_url(self) -> str:
         """Call apps.connections.open to get a fresh WebSocket URL."""
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                "https://slack.com/api/apps.connections.open",
-                headers={
-                    "Authorization": f"Bearer {self._config.app_token}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-            )
-            data = resp.json()
-            if not data.get("ok"):
-                raise RuntimeError(f"apps.connections.open failed: {data.get('error')}")
-            return data["url"]
+        resp = await self._get_http().post(
+            "https://slack.com/api/apps.connections.open",
+            headers={
+                "Authorization": f"Bearer {self._config.app_token}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            timeout=5.0,
+        )
+        data = resp.json()
+        if not data.get("ok"):
+            raise RuntimeError(f"apps.connections.open failed: {data.get('error')}")
+        return data["url"]
 
     async def _connection_loop(self) -> None:
         """Main loop: connect, process, reconnect on failure."""
@@ -180,9 +202,8 @@ class SocketModeAdapter:
 
         while self._running and self._ws and not self._ws.closed:
             try:
-                msg = await asyncio.wait_for(
-                    self._ws.receive(), timeout=_RECEIVE_TIMEOUT
-                )
+                async with asyncio.timeout(_RECEIVE_TIMEOUT):
+                    msg = await self._ws.receive()
             except TimeoutError:
                 logger.warning(
                     f"[socket] No frames received in {_RECEIVE_TIMEOUT}s, "
@@ -190,13 +211,13 @@ class SocketModeAdapter:
                 )
                 break
 
-            logger.debug(f"[socket] Frame: type={msg.type}")
+            logger.debug("[socket] Frame: type=%s", msg.type)
 
             if msg.type == aiohttp.WSMsgType.TEXT:
                 try:
                     data = json.loads(msg.data)
                     frame_type = data.get("type", "?")
-                    logger.debug(f"[socket] TEXT frame: {frame_type}")
+                    logger.debug("[socket] TEXT frame: %s", frame_type)
                     await self._handle_frame(data)
                 except (json.JSONDecodeError, KeyError, ValueError, RuntimeError):
                     logger.exception("Error handling WebSocket frame")
@@ -205,11 +226,7 @@ class SocketModeAdapter:
                 logger.error(f"WebSocket error: {self._ws.exception()}")
                 break
 
-            elif msg.type in (
-                aiohttp.WSMsgType.CLOSE,
-                aiohttp.WSMsgType.CLOSING,
-                aiohttp.WSMsgType.CLOSED,
-            ):
+            elif msg.type in _CLOSE_MSG_TYPES:
                 logger.info("WebSocket closed by server")
                 break
 
@@ -233,35 +250,9 @@ class SocketModeAdapter:
         elif frame_type == "events_api":
             # ACK immediately so Slack doesn't retry (3 s deadline)
             await self._ack(frame)
-            # Extract context for error logging before the task is created
-            _payload = frame.get("payload", {})
-            _event = _payload.get("event", {})
-            _ctx = {
-                "channel": _event.get("channel", "?"),
-                "user": _event.get("user", "?"),
-                "thread_ts": _event.get("thread_ts", ""),
-                "text": _event.get("text", "")[:80],
-            }
             task = asyncio.create_task(self._handle_event(frame))
             self._pending_tasks.add(task)
-
-            def _done_cb(t: asyncio.Task, ctx: dict = _ctx) -> None:
-                self._pending_tasks.discard(t)
-                if not t.cancelled():
-                    exc = t.exception()
-                    if exc:
-                        logger.error(
-                            "[socket] Event task failed "
-                            "channel=%s user=%s thread_ts=%s text=%r: %s",
-                            ctx["channel"],
-                            ctx["user"],
-                            ctx["thread_ts"],
-                            ctx["text"],
-                            exc,
-                            exc_info=exc,
-                        )
-
-            task.add_done_callback(_done_cb)
+            task.add_done_callback(functools.partial(self._on_event_task_done, frame))
 
         elif frame_type == "interactive":
             await self._ack(frame)
@@ -272,6 +263,29 @@ class SocketModeAdapter:
 
         # Ignore pings -- aiohttp handles pong automatically
 
+    def _on_event_task_done(self, frame: dict[str, Any], task: asyncio.Task) -> None:
+        """Forget a finished event task and log its failure, if any.
+
+        Event context for the log line is only pulled out of *frame* when
+        the task actually failed.
+        """
+        self._pending_tasks.discard(task)
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc:
+            event = frame.get("payload", {}).get("event", {})
+            logger.error(
+                "[socket] Event task failed "
+                "channel=%s user=%s thread_ts=%s text=%r: %s",
+                event.get("channel", "?"),
+                event.get("user", "?"),
+                event.get("thread_ts", ""),
+                event.get("text", "")[:80],
+                exc,
+                exc_info=exc,
+            )
+
     async def _handle_event(self, frame: dict[str, Any]) -> None:
         """Process an events_api frame."""
         # NOTE: ACK is sent by _handle_frame before this task starts.
@@ -286,8 +300,12 @@ class SocketModeAdapter:
 
         thread_ts = event.get("thread_ts", "")
         logger.info(
-            f"[socket] Event: type={event_type} user={user} "
-            f"channel={channel} thread_ts={thread_ts or 'none'} text={text!r}"
+            "[socket] Event: type=%s user=%s channel=%s thread_ts=%s text=%r",
+            event_type,
+            user,
+            channel,
+            thread_ts or "none",
+            text,
         )
 
         # Skip our own messages
@@ -307,7 +325,7 @@ class SocketModeAdapter:
             dedup_key = f"{channel}:{msg_ts}"
             if self._is_duplicate(dedup_key):
                 logger.info(
-                    f"[socket] Skipping duplicate event {event_type} for {dedup_key}"
+                    "[socket] Skipping duplicate event %s for %s", event_type, dedup_key
                 )
                 return
 
@@ -318,7 +336,7 @@ class SocketModeAdapter:
         }
         try:
             result = await self._event_handler.handle_event_payload(handler_payload)
-            logger.info(f"[socket] Handler result: {result}")
+            logger.info("[socket] Handler result: %s", result)
         except Exception:
             logger.exception("[socket] Error in event handler")
             raise  # re-raise so the done callback can log it with context
@@ -360,25 +378,25 @@ class SocketModeAdapter:
     def _is_duplicate(self, key: str) -> bool:
         """Check if this event key was recently seen. Records it if not.
 
-        Uses a simple dict with monotonic timestamps. Evicts stale entries
-        periodically to bound memory.
+        Entries are kept in first-seen order, so expired keys are evicted
+        from the front without rebuilding the map. The map is bounded at
+        ``_DEDUP_MAX_SIZE``; past that the oldest key is dropped.
         """
         now = time.monotonic()
+        seen = self._seen_events
 
-        # Evict stale entries if the cache is getting large
-        if len(self._seen_events) > _DEDUP_MAX_SIZE:
-            cutoff = now - _DEDUP_WINDOW_SECS
-            self._seen_events = {
-                k: v for k, v in self._seen_events.items() if v > cutoff
-            }
+        # Evict expired entries, then the oldest if still over the bound
+        cutoff = now - _DEDUP_WINDOW_SECS
+        while seen:
+            first_seen = next(iter(seen.values()))
+            if first_seen > cutoff and len(seen) < _DEDUP_MAX_SIZE:
+                break
+            seen.popitem(last=False)
 
-        if key in self._seen_events:
-            age = now - self._seen_events[key]
-            if age < _DEDUP_WINDOW_SECS:
-                return True
-            # Expired, treat as new
+        if key in seen:
+            return True
 
-        self._seen_events[key] = now
+        seen[key] = now
         return False
 
     async def _ack(
@@ -462,19 +480,19 @@ class SocketModeAdapter:
             if health_counter >= _HEALTH_CHECK_CYCLES:
                 health_counter = 0
                 try:
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        resp = await client.post(
-                            "https://slack.com/api/auth.test",
-                            headers={"Authorization": f"Bearer {self._config.bot_token}"},
+                    resp = await self._get_http().post(
+                        "https://slack.com/api/auth.test",
+                        headers={"Authorization": f"Bearer {self._config.bot_token}"},
+                        timeout=10.0,
+                    )
+                    data = resp.json()
+                    if not data.get("ok"):
+                        logger.warning(
+                            "[watchdog] Health check failed: %s, forcing reconnect",
+                            data.get("error"),
                         )
-                        data = resp.json()
-                        if not data.get("ok"):
-                            logger.warning(
-                                "[watchdog] Health check failed: %s, forcing reconnect",
-                                data.get("error"),
-                            )
-                            if self._ws and not self._ws.closed:
-                                await self._ws.close()
+                        if self._ws and not self._ws.closed:
+                            await self._ws.close()
                 except Exception:
                     logger.warning("[watchdog] Health check error, forcing reconnect", exc_info=True)
                     if self._ws and not self._ws.closed:
@@ -496,18 +514,21 @@ class SocketModeAdapter:
 
         await self._close_ws()
 
-        # Drain pending event tasks
+        # Drain pending event tasks; on timeout gather cancels the stragglers
+        # and waits for them to unwind. Failures are logged by the done
+        # callbacks, so results are discarded here.
         if self._pending_tasks:
-            _tasks_snapshot = set(self._pending_tasks)
-            _, still_pending = await asyncio.wait(_tasks_snapshot, timeout=30.0)
-            for task in still_pending:
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(30.0):
+                    await asyncio.gather(*self._pending_tasks, return_exceptions=True)
 
         if self._task and not self._task.done():
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
 
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
         logger.info("Socket Mode adapter stopped")
@@ -0,0 +1,54 @@
+"""Tests for slack_plugin.discovery — get_session lookups and the session index."""
+
+from __future__ import annotations
+
+import json
+
+from slack_plugin.discovery import AmplifierDiscovery
+
+
+def _make_session(home, project, session_id, name=""):
+    session_dir = home / "projects" / project / "sessions" / session_id
+    session_dir.mkdir(parents=True)
+    (session_dir / "transcript.jsonl").write_text("{}\n")
+    if name:
+        (session_dir / "metadata.json").write_text(json.dumps({"name": name}))
+    return session_dir
+
+
+def test_get_session_finds_and_indexes_session(tmp_path):
+    _make_session(tmp_path, "-home-sam-dev-app", "abc123", name="demo")
+    discovery = AmplifierDiscovery(str(tmp_path))
+
+    session = discovery.get_session("abc123")
+
+    assert session is not None
+    assert session.name == "demo"
+    assert session.project_path == "/home/sam/dev/app"
+    # A second lookup is served from the index
+    assert discovery.get_session("abc123") == session
+
+
+def test_get_session_relocates_moved_session(tmp_path):
+    old_dir = _make_session(tmp_path, "-home-sam-dev-app", "abc123")
+    discovery = AmplifierDiscovery(str(tmp_path))
+    assert discovery.get_session("abc123") is not None
+
+    (old_dir / "transcript.jsonl").unlink()
+    old_dir.rmdir()
+    _make_session(tmp_path, "-home-sam-dev-other", "abc123")
+
+    session = discovery.get_session("abc123")
+    assert session is not None
+    assert session.project_path == "/home/sam/dev/other"
+
+
+def test_get_session_returns_none_once_deleted(tmp_path):
+    session_dir = _make_session(tmp_path, "-home-sam-dev-app", "abc123")
+    discovery = AmplifierDiscovery(str(tmp_path))
+    assert discovery.get_session("abc123") is not None
+
+    (session_dir / "transcript.jsonl").unlink()
+
+    assert discovery.get_session("abc123") is None
+    assert discovery.get_session("missing") is None
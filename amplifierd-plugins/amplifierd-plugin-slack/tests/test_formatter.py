@@ -0,0 +1,17 @@
+"""Tests for slack_plugin.formatter — code-region placeholders."""
+
+from __future__ import annotations
+
+from slack_plugin.formatter import SlackFormatter
+
+
+def test_code_regions_survive_conversion():
+    text = "**bold** `**not bold**`\n```py\nx = **y**\n```"
+    assert SlackFormatter.markdown_to_slack(text) == (
+        "*bold* `**not bold**`\n```\nx = **y**\n```"
+    )
+
+
+def test_unmatched_placeholder_text_passes_through():
+    text = "a \x00PH7\x00PH b `x`"
+    assert SlackFormatter.markdown_to_slack(text) == text
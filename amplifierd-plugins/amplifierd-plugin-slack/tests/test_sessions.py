@@ -0,0 +1,155 @@
+"""Tests for slack_plugin.sessions — mapping persistence and flush()."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from slack_plugin.backend_adapter import SessionInfo
+from slack_plugin.client import MemorySlackClient
+from slack_plugin.config import SlackConfig
+from slack_plugin.models import SlackMessage
+from slack_plugin.sessions import SlackSessionManager
+
+
+class FakeBackend:
+    """Backend stand-in that hands out sequential session IDs."""
+
+    def __init__(self) -> None:
+        self._count = 0
+        self.ended: list[str] = []
+
+    async def create_session(
+        self,
+        working_dir: str = "~",
+        bundle_name: str | None = None,
+        description: str = "",
+    ) -> SessionInfo:
+        self._count += 1
+        return SessionInfo(
+            session_id=f"sess-{self._count}",
+            working_dir=working_dir,
+            description=description,
+        )
+
+    async def send_message(self, session_id: str, message: str) -> str:
+        return f"echo: {message}"
+
+    async def end_session(self, session_id: str) -> None:
+        self.ended.append(session_id)
+
+
+def _manager(path) -> SlackSessionManager:
+    return SlackSessionManager(
+        MemorySlackClient(), FakeBackend(), SlackConfig(), persistence_path=path
+    )
+
+
+def _on_disk(path) -> dict[str, dict]:
+    return {entry["session_id"]: entry for entry in json.loads(path.read_text())}
+
+
+@pytest.mark.asyncio
+async def test_flush_then_reload_round_trips_mappings(tmp_path):
+    path = tmp_path / "slack-sessions.json"
+    manager = _manager(path)
+
+    kept = await manager.create_session("C1", "100.1", "U1", description="kept")
+    ended = await manager.create_session("C1", "200.2", "U1", description="ended")
+    response = await manager.route_message(
+        SlackMessage(
+            channel_id="C1", user_id="U1", text="hi", ts="101.1", thread_ts="100.1"
+        )
+    )
+    assert response == "echo: hi"
+    assert await manager.end_session("C1", "200.2")
+    manager.flush()
+
+    reloaded = _manager(path)
+
+    assert set(reloaded.mappings) == {"C1:100.1", "C1:200.2"}
+    assert [m.session_id for m in reloaded.list_active()] == [kept.session_id]
+    restored_kept = reloaded.get_mapping("C1", "100.1")
+    assert restored_kept.last_active == kept.last_active
+    assert restored_kept.description == "kept"
+    assert reloaded.get_mapping("C1", "200.2").session_id == ended.session_id
+    assert not reloaded.get_mapping("C1", "200.2").is_active
+
+
+@pytest.mark.asyncio
+async def test_last_active_bump_is_deferred_until_flush(tmp_path):
+    path = tmp_path / "slack-sessions.json"
+    manager = _manager(path)
+
+    mapping = await manager.create_session("C1", "100.1", "U1")
+    manager.flush()
+    created_at = _on_disk(path)[mapping.session_id]["last_active"]
+
+    # Within the save interval, routing only marks the table dirty.
+    await manager.route_message(
+        SlackMessage(
+            channel_id="C1", user_id="U1", text="hi", ts="101.1", thread_ts="100.1"
+        )
+    )
+    assert _on_disk(path)[mapping.session_id]["last_active"] == created_at
+
+    manager.flush()
+    assert _on_disk(path)[mapping.session_id]["last_active"] == mapping.last_active
+
+
+def test_flush_without_persistence_is_a_no_op():
+    manager = _manager(None)
+    manager.flush()
+    assert manager.mappings == {}
+
+
+@pytest.mark.asyncio
+async def test_deactivating_stale_mapping_keeps_replacement_active(tmp_path):
+    manager = _manager(None)
+    old = await manager.create_session("C1", "100.1", "U1")
+    new = await manager.create_session("C1", "100.1", "U1")
+
+    manager._deactivate(old)
+
+    assert not old.is_active
+    assert manager.list_active() == [new]
+
+
+@pytest.mark.asyncio
+async def test_dead_session_during_send_keeps_replacement_active(tmp_path):
+    manager = _manager(None)
+    backend = manager._backend
+    await manager.create_session("C1", "100.1", "U1")
+    replacement: list = []
+
+    async def send_message(session_id: str, message: str) -> str:
+        # The thread gets a new session while the old one's send is in flight
+        replacement.append(await manager.create_session("C1", "100.1", "U1"))
+        raise ValueError(f"Session {session_id} not found")
+
+    backend.send_message = send_message
+    await manager.route_message(
+        SlackMessage(
+            channel_id="C1", user_id="U1", text="hi", ts="101.1", thread_ts="100.1"
+        )
+    )
+
+    assert manager.list_active() == replacement
+
+
+@pytest.mark.asyncio
+async def test_writer_failures_are_logged(tmp_path, monkeypatch, caplog):
+    def broken_write(path, content):
+        raise TypeError("boom")
+
+    monkeypatch.setattr("slack_plugin._fileutil.atomic_write", broken_write)
+    manager = _manager(tmp_path / "slack-sessions.json")
+
+    with caplog.at_level(logging.ERROR, logger="slack_plugin.sessions"):
+        await manager.create_session("C1", "100.1", "U1")
+        manager.flush()
+
+    assert "Unexpected error saving session mappings" in caplog.text
+    assert "TypeError: boom" in caplog.text
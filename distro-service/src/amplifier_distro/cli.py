@@ -5,7 +5,6 @@ Additional commands: backup, restore, doctor, service
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 from pathlib import Path
@@ -15,57 +14,65 @@ import click
 from . import conventions
 
 
+def _amplifier_home() -> Path:
+    """Return the expanded Amplifier home directory."""
+    return Path(conventions.AMPLIFIER_HOME).expanduser()
+
+
 def _is_non_localhost(host: str) -> bool:
     """Return True if host is not a localhost address."""
     return host not in ("127.0.0.1", "localhost", "::1")
 
 
+# Shared CLI options for starting the experience server, built once at import.
+_SERVE_OPTIONS = (
+    click.option(
+        "--host",
+        default=None,
+        help="Bind host address. Use 0.0.0.0 for network access (enables TLS+auth).",
+    ),
+    click.option("--port", default=None, type=int, help="Bind port number."),
+    click.option(
+        "--tls",
+        "tls_mode",
+        default=None,
+        type=click.Choice(["auto", "off", "manual"], case_sensitive=False),
+        help="TLS mode.",
+    ),
+    click.option(
+        "--ssl-certfile",
+        default=None,
+        help="Path to SSL certificate file (implies --tls manual).",
+    ),
+    click.option(
+        "--ssl-keyfile",
+        default=None,
+        help="Path to SSL private key file (used with --ssl-certfile).",
+    ),
+    click.option(
+        "--no-auth", is_flag=True, default=False, help="Disable authentication."
+    ),
+    click.option(
+        "--reload",
+        is_flag=True,
+        default=False,
+        help="Enable hot-reload for development.",
+    ),
+    click.option(
+        "--log-level", default=None, help="Log level: debug|info|warning|error."
+    ),
+    click.option(
+        "--no-browser",
+        is_flag=True,
+        default=False,
+        help="Do not open a browser tab when the server becomes ready.",
+    ),
+)
+
+
 def _serve_options(func):
-    """Shared CLI options for starting the experience server."""
-    options = [
-        click.option(
-            "--host",
-            default=None,
-            help="Bind host address. Use 0.0.0.0 for network access (enables TLS+auth).",
-        ),
-        click.option("--port", default=None, type=int, help="Bind port number."),
-        click.option(
-            "--tls",
-            "tls_mode",
-            default=None,
-            type=click.Choice(["auto", "off", "manual"], case_sensitive=False),
-            help="TLS mode.",
-        ),
-        click.option(
-            "--ssl-certfile",
-            default=None,
-            help="Path to SSL certificate file (implies --tls manual).",
-        ),
-        click.option(
-            "--ssl-keyfile",
-            default=None,
-            help="Path to SSL private key file (used with --ssl-certfile).",
-        ),
-        click.option(
-            "--no-auth", is_flag=True, default=False, help="Disable authentication."
-        ),
-        click.option(
-            "--reload",
-            is_flag=True,
-            default=False,
-            help="Enable hot-reload for development.",
-        ),
-        click.option(
-            "--log-level", default=None, help="Log level: debug|info|warning|error."
-        ),
-        click.option(
-            "--no-browser",
-            is_flag=True,
-            default=False,
-            help="Do not open a browser tab when the server becomes ready.",
-        ),
-    ]
-    for option in reversed(options):
+    """Apply the shared server-start options to a click command."""
+    for option in reversed(_SERVE_OPTIONS):
         func = option(func)
     return func
 
@@ -175,6 +182,7 @@ def _wait_and_announce(
     *,
     open_browser: bool,
     poll_interval: float = 2.0,
+    startup_poll_interval: float = 0.25,
     timeout: float = 300.0,
 ) -> None:
     """Background thread: open browser when server accepts connections, announce when ready.
@@ -182,12 +190,15 @@ def _wait_and_announce(
     Two-phase approach:
       Phase 1 — Wait for the server to start accepting HTTP requests (loading
                  page is live).  Opens the browser at this point so the user
-                 sees the loading screen while pre-warm continues.
+                 sees the loading screen while pre-warm continues.  Polls every
+                 *startup_poll_interval* seconds: a refused connection fails
+                 instantly, so a short interval opens the browser promptly.
       Phase 2 — Continue polling until /ready returns {"ready": true}, then
                  re-print the URL prominently so it is visible in the log.
 
     Runs as a daemon thread — never raises; swallows all exceptions silently.
     """
+    import json
     import ssl
     import time
     import urllib.request
@@ -214,7 +225,7 @@ def _wait_and_announce(
             break  # server is up but still warming — move to phase 2
         except Exception:
             pass
-        time.sleep(poll_interval)
+        time.sleep(startup_poll_interval)
     else:
         # Timed out before server accepted any connection — surface URL and bail.
         click.echo(f"\n  amp-distro: {url}\n")
@@ -312,11 +323,7 @@ def _start_server(
     _ready_thread.start()
 
     # Write PID file so doctor and other tools can find the running server.
-    pid_path = (
-        Path(conventions.AMPLIFIER_HOME).expanduser()
-        / conventions.SERVER_DIR
-        / conventions.SERVER_PID_FILE
-    )
+    pid_path = _amplifier_home() / conventions.SERVER_DIR / conventions.SERVER_PID_FILE
     write_pid(pid_path)
 
     # Delegate to amplifierd's serve command.
@@ -360,7 +367,7 @@ def backup_cmd(name: str) -> None:
         )
         sys.exit(1)
 
-    amplifier_home = Path(conventions.AMPLIFIER_HOME).expanduser()
+    amplifier_home = _amplifier_home()
     click.echo("Starting backup...")
     result = backup(amplifier_home, gh_handle, repo_name=name)
 
@@ -388,7 +395,7 @@ def restore_cmd(name: str) -> None:
         )
         sys.exit(1)
 
-    amplifier_home = Path(conventions.AMPLIFIER_HOME).expanduser()
+    amplifier_home = _amplifier_home()
     click.echo("Starting restore...")
     result = restore(amplifier_home, gh_handle, repo_name=name)
 
@@ -416,7 +423,7 @@ def doctor_cmd(fix: bool, as_json: bool) -> None:
     """
     from .doctor import run_diagnostics, run_fixes
 
-    amplifier_home = Path(conventions.AMPLIFIER_HOME).expanduser()
+    amplifier_home = _amplifier_home()
     report = run_diagnostics(amplifier_home)
 
     # Apply fixes if requested
@@ -438,8 +445,11 @@ def doctor_cmd(fix: bool, as_json: bool) -> None:
 
 
 def _print_doctor_report(report: object, fixes: list[str]) -> None:
-    """Format and print a doctor report with coloured status markers."""
-    click.echo("Amplifier Distro - Doctor\n")
+    """Format and print a doctor report with coloured status markers.
+
+    The report is assembled first and written with a single echo.
+    """
+    lines = ["Amplifier Distro - Doctor\n"]
 
     for check in report.checks:  # type: ignore[union-attr]
         if check.status == "ok":
@@ -449,25 +459,28 @@ def _print_doctor_report(report: object, fixes: list[str]) -> None:
         else:
             mark = click.style("\u2718", fg="red")  # X
 
-        click.echo(f"  {mark} {check.name}: {check.message}")
+        lines.append(f"  {mark} {check.name}: {check.message}")
 
         # Show fix suggestion for non-ok checks that have a fix
         if check.status != "ok" and check.fix_available:
-            click.echo(click.style(f"    fix: {check.fix_description}", fg="cyan"))
+            lines.append(click.style(f"    fix: {check.fix_description}", fg="cyan"))
 
     # Summary
     s = report.summary  # type: ignore[union-attr]
-    click.echo(f"\n  {s['ok']} ok, {s['warning']} warning(s), {s['error']} error(s)")
+    lines.append(f"\n  {s['ok']} ok, {s['warning']} warning(s), {s['error']} error(s)")
 
     if fixes:
-        click.echo("\nFixes applied:")
+        lines.append("\nFixes applied:")
         checkmark = click.style("\u2714", fg="green")
-        for f in fixes:
-            click.echo(f"  {checkmark} {f}")
+        lines.extend(f"  {checkmark} {f}" for f in fixes)
+
+    click.echo("\n".join(lines))
 
 
 def _print_doctor_json(report: object, fixes: list[str]) -> None:
     """Print the doctor report as machine-readable JSON."""
+    import json
+
     data = {
         "checks": [c.model_dump() for c in report.checks],  # type: ignore[union-attr]
         "summary": report.summary,  # type: ignore[union-attr]
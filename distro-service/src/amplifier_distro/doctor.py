@@ -27,7 +27,7 @@ from pydantic import BaseModel, Field
 from . import conventions
 from amplifierd.security import tailscale
 from .distro_settings import load as load_settings
-from .server.daemon import is_running, read_pid
+from .server.daemon import pid_alive, read_pid
 
 # ---------------------------------------------------------------------------
 # Models
@@ -85,13 +85,14 @@ def _read_keys_env(keys_path: Path) -> dict[str, str]:
     """
     result: dict[str, str] = {}
     try:
-        for line in keys_path.read_text().splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" in line:
-                key, _, value = line.partition("=")
-                result[key.strip()] = value.strip()
+        with keys_path.open() as f:
+            for raw_line in f:
+                line = raw_line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if "=" in line:
+                    key, _, value = line.partition("=")
+                    result[key.strip()] = value.strip()
     except OSError:
         pass
     return result
@@ -300,7 +301,7 @@ def _check_server_running(home: Path) -> DiagnosticCheck:
             fix_available=True,
             fix_description="Remove stale PID file",
         )
-    if is_running(pid_path):
+    if pid_alive(pid):
         return DiagnosticCheck(
             name="Server status",
             status=CheckStatus.ok,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import ipaddress
 import os
 import socket
 from pathlib import Path
@@ -15,11 +16,8 @@ def read_pid(pid_path: Path) -> int | None:
         return None
 
 
-def is_running(pid_path: Path) -> bool:
-    """Return True if the PID in the file corresponds to a live process."""
-    pid = read_pid(pid_path)
-    if pid is None:
-        return False
+def pid_alive(pid: int) -> bool:
+    """Return True if *pid* corresponds to a live process."""
     try:
         os.kill(pid, 0)  # signal 0 = existence check, no signal sent
         return True
@@ -27,6 +25,14 @@ def is_running(pid_path: Path) -> bool:
         return False
 
 
+def is_running(pid_path: Path) -> bool:
+    """Return True if the PID in the file corresponds to a live process."""
+    pid = read_pid(pid_path)
+    if pid is None:
+        return False
+    return pid_alive(pid)
+
+
 def write_pid(pid_path: Path, pid: int | None = None) -> None:
     """Write the current (or given) PID to a .pid file."""
     if pid is None:
@@ -43,13 +49,29 @@ def remove_pid(pid_path: Path) -> None:
         pass
 
 
+def _bind_family(host: str) -> socket.AddressFamily:
+    """Return the address family uvicorn will bind *host* with.
+
+    Only IPv6 address literals get ``AF_INET6``; hostnames such as
+    ``localhost`` are bound over IPv4, whatever ``getaddrinfo`` lists first.
+    """
+    try:
+        if ipaddress.ip_address(host).version == 6:
+            return socket.AF_INET6
+    except ValueError:
+        pass
+    return socket.AF_INET
+
+
 def check_port(host: str, port: int) -> bool:
     """Return True if the port is available for binding.
 
-    Probes using the same address family that the server will use.
+    Probes using the same address family that the server will use (IPv6
+    only for an IPv6 literal such as ``::1``).  The bind probe itself is
+    local, but binding a hostname may need a DNS lookup to resolve it.
     """
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        with socket.socket(_bind_family(host), socket.SOCK_STREAM) as sock:
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             sock.bind((host, port))
             return True
@@ -19,7 +19,9 @@ import platform
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 from textwrap import dedent
 
 from pydantic import BaseModel, Field
@@ -195,6 +197,18 @@ def _run_cmd(cmd: list[str], timeout: int = 10) -> tuple[bool, str]:
         return False, f"Command timed out: {' '.join(cmd)}"
 
 
+def _run_cmds_concurrently(cmds: list[list[str]]) -> list[tuple[bool, str]]:
+    """Run independent commands in parallel; results are in input order.
+
+    Used for read-only status probes so the wall time is the slowest probe
+    rather than the sum of all of them.
+    """
+    if len(cmds) <= 1:
+        return [_run_cmd(cmd) for cmd in cmds]
+    with ThreadPoolExecutor(max_workers=len(cmds)) as pool:
+        return list(pool.map(_run_cmd, cmds))
+
+
 # ===========================================================================
 # Linux: systemd (user service)
 # ===========================================================================
@@ -204,6 +218,16 @@ def _run_cmd(cmd: list[str], timeout: int = 10) -> tuple[bool, str]:
 #   Watchdog: ~/.config/systemd/user/amplifier-distro-watchdog.service
 
 
+def _amplifier_home() -> Path:
+    """Return the expanded Amplifier home directory."""
+    return Path(conventions.AMPLIFIER_HOME).expanduser()
+
+
+def _server_dir() -> Path:
+    """Return the server state directory under the Amplifier home."""
+    return _amplifier_home() / conventions.SERVER_DIR
+
+
 def _systemd_dir() -> Path:
     """Return the systemd user service directory."""
     return Path.home() / ".config" / "systemd" / "user"
@@ -219,6 +243,38 @@ def _systemd_watchdog_unit_path() -> Path:
     return _systemd_dir() / f"{conventions.SERVICE_NAME}-watchdog.service"
 
 
+# Unit file and plist templates are dedented once at import; the generators
+# below only substitute values into them.
+_SYSTEMD_SERVER_UNIT = Template(
+    dedent("""\
+    [Unit]
+    Description=Amplifier Distro Server
+    After=network.target
+
+    [Service]
+    Type=simple
+    ExecStart=${exec_start}
+    Restart=always
+    # Note: Restart=always (not on-failure) is intentional. The watchdog triggers
+    # restarts by exiting with code 1, which causes systemd to restart the watchdog
+    # unit. On clean exits (e.g. SIGTERM from the watchdog supervisor path), systemd
+    # must also restart. systemctl stop works — systemd sets an inhibit-restart
+    # flag on admin stops that overrides this policy.
+    RestartSec=5
+    StartLimitIntervalSec=60
+    StartLimitBurst=5
+    WorkingDirectory=%h
+    Environment=PATH=${path_env}
+    EnvironmentFile=-${amplifier_home}/.env
+    StandardOutput=journal
+    StandardError=journal
+
+    [Install]
+    WantedBy=default.target
+""")
+)
+
+
 def _generate_systemd_server_unit(
     distro_bin: str, host: str, port: int, tls_mode: str | None = None
 ) -> str:
@@ -234,36 +290,40 @@ def _generate_systemd_server_unit(
         Complete systemd unit file content as a string.
     """
     path_env = os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin")
-    amplifier_home = Path(conventions.AMPLIFIER_HOME).expanduser()
     exec_start = f"{distro_bin} --host {host} --port {port}"
     if tls_mode is not None:
         exec_start += f" --tls {tls_mode}"
-    return dedent(f"""\
-        [Unit]
-        Description=Amplifier Distro Server
-        After=network.target
-
-        [Service]
-        Type=simple
-        ExecStart={exec_start}
-        Restart=always
-        # Note: Restart=always (not on-failure) is intentional. The watchdog triggers
-        # restarts by exiting with code 1, which causes systemd to restart the watchdog
-        # unit. On clean exits (e.g. SIGTERM from the watchdog supervisor path), systemd
-        # must also restart. systemctl stop works — systemd sets an inhibit-restart
-        # flag on admin stops that overrides this policy.
-        RestartSec=5
-        StartLimitIntervalSec=60
-        StartLimitBurst=5
-        WorkingDirectory=%h
-        Environment=PATH={path_env}
-        EnvironmentFile=-{amplifier_home}/.env
-        StandardOutput=journal
-        StandardError=journal
-
-        [Install]
-        WantedBy=default.target
-    """)
+    return _SYSTEMD_SERVER_UNIT.substitute(
+        exec_start=exec_start,
+        path_env=path_env,
+        amplifier_home=_amplifier_home(),
+    )
+
+
+_SYSTEMD_WATCHDOG_UNIT = Template(
+    dedent("""\
+    [Unit]
+    Description=Amplifier Distro Watchdog
+    After=${service_name}.service
+    Wants=${service_name}.service
+
+    [Service]
+    Type=simple
+    ExecStart=${distro_bin} watchdog --host ${host} --port ${port}
+    Restart=always
+    RestartSec=10
+    StartLimitIntervalSec=300
+    StartLimitBurst=3
+    WorkingDirectory=%h
+    Environment=PATH=${path_env}
+    EnvironmentFile=-${amplifier_home}/.env
+    StandardOutput=journal
+    StandardError=journal
+
+    [Install]
+    WantedBy=default.target
+""")
+)
 
 
 def _generate_systemd_watchdog_unit(distro_bin: str, host: str, port: int) -> str:
@@ -283,29 +343,14 @@ def _generate_systemd_watchdog_unit(distro_bin: str, host: str, port: int) -> st
     """
     path_env = os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin")
     service_name = conventions.SERVICE_NAME
-    amplifier_home = Path(conventions.AMPLIFIER_HOME).expanduser()
-    return dedent(f"""\
-        [Unit]
-        Description=Amplifier Distro Watchdog
-        After={service_name}.service
-        Wants={service_name}.service
-
-        [Service]
-        Type=simple
-        ExecStart={distro_bin} watchdog --host {host} --port {port}
-        Restart=always
-        RestartSec=10
-        StartLimitIntervalSec=300
-        StartLimitBurst=3
-        WorkingDirectory=%h
-        Environment=PATH={path_env}
-        EnvironmentFile=-{amplifier_home}/.env
-        StandardOutput=journal
-        StandardError=journal
-
-        [Install]
-        WantedBy=default.target
-    """)
+    return _SYSTEMD_WATCHDOG_UNIT.substitute(
+        service_name=service_name,
+        distro_bin=distro_bin,
+        host=host,
+        port=port,
+        path_env=path_env,
+        amplifier_home=_amplifier_home(),
+    )
 
 
 def _install_systemd(
@@ -322,8 +367,8 @@ def _install_systemd(
     3. Generate and write server unit file.
     4. If include_watchdog: generate and write watchdog unit file.
     5. Run: systemctl --user daemon-reload.
-    6. Enable and start server service.
-    7. If include_watchdog: enable and start watchdog service.
+    6. Enable and start the server (and, if include_watchdog, the
+       watchdog) service in one systemctl call.
 
     Args:
         include_watchdog: Whether to also install the watchdog service.
@@ -352,20 +397,23 @@ def _install_systemd(
     systemd_dir = _systemd_dir()
     systemd_dir.mkdir(parents=True, exist_ok=True)
 
-    # Write server unit
-    server_unit_path = _systemd_server_unit_path()
-    server_unit_path.write_text(
-        _generate_systemd_server_unit(distro_bin, host, port, tls_mode=tls_mode)
-    )
-    details.append(f"Wrote {server_unit_path}")
-
-    # Write watchdog unit
+    # Write server (and watchdog) units
+    unit_files = [
+        (
+            _systemd_server_unit_path(),
+            _generate_systemd_server_unit(distro_bin, host, port, tls_mode=tls_mode),
+        )
+    ]
     if include_watchdog:
-        watchdog_unit_path = _systemd_watchdog_unit_path()
-        watchdog_unit_path.write_text(
-            _generate_systemd_watchdog_unit(distro_bin, host, port)
+        unit_files.append(
+            (
+                _systemd_watchdog_unit_path(),
+                _generate_systemd_watchdog_unit(distro_bin, host, port),
+            )
         )
-        details.append(f"Wrote {watchdog_unit_path}")
+    for unit_path, content in unit_files:
+        unit_path.write_text(content)
+        details.append(f"Wrote {unit_path}")
 
     # Reload systemd
     ok, output = _run_cmd(["systemctl", "--user", "daemon-reload"])
@@ -378,33 +426,22 @@ def _install_systemd(
         )
     details.append("Reloaded systemd daemon")
 
-    # Enable and start server
+    # Enable and start server (and watchdog) with one systemctl call
     service_name = conventions.SERVICE_NAME
-    ok, output = _run_cmd(
-        ["systemctl", "--user", "enable", "--now", f"{service_name}.service"]
-    )
+    units = [f"{service_name}.service"]
+    if include_watchdog:
+        units.append(f"{service_name}-watchdog.service")
+    ok, output = _run_cmd(["systemctl", "--user", "enable", "--now", *units])
     if ok:
-        details.append(f"Enabled and started {service_name}.service")
+        details.extend(f"Enabled and started {unit}" for unit in units)
     else:
-        details.append(f"Warning: could not enable {service_name}.service: {output}")
-
-    # Enable and start watchdog
-    if include_watchdog:
-        ok, output = _run_cmd(
-            [
-                "systemctl",
-                "--user",
-                "enable",
-                "--now",
-                f"{service_name}-watchdog.service",
-            ]
-        )
-        if ok:
-            details.append(f"Enabled and started {service_name}-watchdog.service")
-        else:
-            details.append(
-                f"Warning: could not enable {service_name}-watchdog.service: {output}"
-            )
+        # A failing unit fails the whole batch; retry singly to see which.
+        for unit in units:
+            ok, output = _run_cmd(["systemctl", "--user", "enable", "--now", unit])
+            if ok:
+                details.append(f"Enabled and started {unit}")
+            else:
+                details.append(f"Warning: could not enable {unit}: {output}")
 
     # Enable linger for WSL2 (user services start at boot without login)
     user = os.environ.get("USER") or getpass.getuser()
@@ -437,11 +474,16 @@ def _uninstall_systemd() -> ServiceResult:
     details: list[str] = []
     service_name = conventions.SERVICE_NAME
 
-    # Stop and disable watchdog (ignore errors if not installed)
-    for unit in [f"{service_name}-watchdog.service", f"{service_name}.service"]:
-        _run_cmd(["systemctl", "--user", "stop", unit])
-        _run_cmd(["systemctl", "--user", "disable", unit])
-        details.append(f"Stopped and disabled {unit}")
+    # Stop and disable both units in one call (watchdog first). If either
+    # is not installed the batch fails, so fall back to per-unit calls and
+    # ignore their errors.
+    units = [f"{service_name}-watchdog.service", f"{service_name}.service"]
+    ok, _ = _run_cmd(["systemctl", "--user", "disable", "--now", *units])
+    if not ok:
+        for unit in units:
+            _run_cmd(["systemctl", "--user", "stop", unit])
+            _run_cmd(["systemctl", "--user", "disable", unit])
+    details.extend(f"Stopped and disabled {unit}" for unit in units)
 
     # Remove unit files
     for path in [_systemd_watchdog_unit_path(), _systemd_server_unit_path()]:
@@ -470,12 +512,28 @@ def _status_systemd() -> ServiceResult:
     details: list[str] = []
     service_name = conventions.SERVICE_NAME
 
-    # Check server
     server_unit = _systemd_server_unit_path()
-    if server_unit.exists():
-        _ok, output = _run_cmd(
-            ["systemctl", "--user", "is-active", f"{service_name}.service"]
+    watchdog_unit = _systemd_watchdog_unit_path()
+    server_installed = server_unit.exists()
+    watchdog_installed = watchdog_unit.exists()
+
+    probes: list[list[str]] = []
+    if server_installed:
+        probes.append(["systemctl", "--user", "is-active", f"{service_name}.service"])
+    if watchdog_installed:
+        probes.append(
+            [
+                "systemctl",
+                "--user",
+                "is-active",
+                f"{service_name}-watchdog.service",
+            ]
         )
+    results = iter(_run_cmds_concurrently(probes))
+
+    # Check server
+    if server_installed:
+        _ok, output = next(results)
         state = output.strip()
         details.append(f"Server service: installed ({state})")
 
@@ -495,22 +553,14 @@ def _status_systemd() -> ServiceResult:
         details.append("Server service: not installed")
 
     # Check watchdog
-    watchdog_unit = _systemd_watchdog_unit_path()
-    if watchdog_unit.exists():
-        _ok, output = _run_cmd(
-            [
-                "systemctl",
-                "--user",
-                "is-active",
-                f"{service_name}-watchdog.service",
-            ]
-        )
+    if watchdog_installed:
+        _ok, output = next(results)
         state = output.strip()
         details.append(f"Watchdog service: installed ({state})")
     else:
         details.append("Watchdog service: not installed")
 
-    installed = server_unit.exists() or watchdog_unit.exists()
+    installed = server_installed or watchdog_installed
     return ServiceResult(
         success=True,
         platform="linux",
@@ -543,6 +593,47 @@ def _launchd_watchdog_plist_path() -> Path:
     return _launchd_dir() / f"{conventions.LAUNCHD_LABEL}.watchdog.plist"
 
 
+_LAUNCHD_SERVER_PLIST = Template(
+    dedent("""\
+    <?xml version="1.0" encoding="UTF-8"?>
+    <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
+      "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+    <plist version="1.0">
+    <dict>
+        <key>Label</key>
+        <string>${label}</string>
+        <key>ProgramArguments</key>
+        <array>
+            <string>${distro_bin}</string>
+            <string>--host</string>
+            <string>${host}</string>
+            <string>--port</string>
+            <string>${port}</string>
+        </array>
+        <key>RunAtLoad</key>
+        <true/>
+        <key>KeepAlive</key>
+        <dict>
+            <key>SuccessfulExit</key>
+            <false/>
+        </dict>
+        <key>WorkingDirectory</key>
+        <string>${home}</string>
+        <key>StandardOutPath</key>
+        <string>${srv_dir}/launchd-stdout.log</string>
+        <key>StandardErrorPath</key>
+        <string>${srv_dir}/launchd-stderr.log</string>
+        <key>EnvironmentVariables</key>
+        <dict>
+            <key>PATH</key>
+            <string>${path_env}</string>
+        </dict>
+    </dict>
+    </plist>
+""")
+)
+
+
 def _generate_launchd_server_plist(distro_bin: str, host: str, port: int) -> str:
     """Generate a launchd plist for the server.
 
@@ -559,47 +650,57 @@ def _generate_launchd_server_plist(distro_bin: str, host: str, port: int) -> str
     """
     label = conventions.LAUNCHD_LABEL
     home = str(Path.home())
-    srv_dir = str(
-        Path(conventions.AMPLIFIER_HOME).expanduser() / conventions.SERVER_DIR
-    )
+    srv_dir = str(_server_dir())
     path_env = os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin")
-    return dedent(f"""\
-        <?xml version="1.0" encoding="UTF-8"?>
-        <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-          "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-        <plist version="1.0">
+    return _LAUNCHD_SERVER_PLIST.substitute(
+        label=label,
+        distro_bin=distro_bin,
+        host=host,
+        port=port,
+        home=home,
+        srv_dir=srv_dir,
+        path_env=path_env,
+    )
+
+
+_LAUNCHD_WATCHDOG_PLIST = Template(
+    dedent("""\
+    <?xml version="1.0" encoding="UTF-8"?>
+    <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
+      "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+    <plist version="1.0">
+    <dict>
+        <key>Label</key>
+        <string>${label}</string>
+        <key>ProgramArguments</key>
+        <array>
+            <string>${distro_bin}</string>
+            <string>watchdog</string>
+            <string>--supervised</string>
+            <string>--host</string>
+            <string>${host}</string>
+            <string>--port</string>
+            <string>${port}</string>
+        </array>
+        <key>RunAtLoad</key>
+        <true/>
+        <key>KeepAlive</key>
+        <true/>
+        <key>WorkingDirectory</key>
+        <string>${home}</string>
+        <key>StandardOutPath</key>
+        <string>${srv_dir}/watchdog-launchd-stdout.log</string>
+        <key>StandardErrorPath</key>
+        <string>${srv_dir}/watchdog-launchd-stderr.log</string>
+        <key>EnvironmentVariables</key>
         <dict>
-            <key>Label</key>
-            <string>{label}</string>
-            <key>ProgramArguments</key>
-            <array>
-                <string>{distro_bin}</string>
-                <string>--host</string>
-                <string>{host}</string>
-                <string>--port</string>
-                <string>{port}</string>
-            </array>
-            <key>RunAtLoad</key>
-            <true/>
-            <key>KeepAlive</key>
-            <dict>
-                <key>SuccessfulExit</key>
-                <false/>
-            </dict>
-            <key>WorkingDirectory</key>
-            <string>{home}</string>
-            <key>StandardOutPath</key>
-            <string>{srv_dir}/launchd-stdout.log</string>
-            <key>StandardErrorPath</key>
-            <string>{srv_dir}/launchd-stderr.log</string>
-            <key>EnvironmentVariables</key>
-            <dict>
-                <key>PATH</key>
-                <string>{path_env}</string>
-            </dict>
+            <key>PATH</key>
+            <string>${path_env}</string>
         </dict>
-        </plist>
-    """)
+    </dict>
+    </plist>
+""")
+)
 
 
 def _generate_launchd_watchdog_plist(distro_bin: str, host: str, port: int) -> str:
@@ -617,46 +718,17 @@ def _generate_launchd_watchdog_plist(distro_bin: str, host: str, port: int) -> s
     """
     label = f"{conventions.LAUNCHD_LABEL}.watchdog"
     home = str(Path.home())
-    srv_dir = str(
-        Path(conventions.AMPLIFIER_HOME).expanduser() / conventions.SERVER_DIR
-    )
+    srv_dir = str(_server_dir())
     path_env = os.environ.get("PATH", "/usr/local/bin:/usr/bin:/bin")
-    return dedent(f"""\
-        <?xml version="1.0" encoding="UTF-8"?>
-        <!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN"
-          "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-        <plist version="1.0">
-        <dict>
-            <key>Label</key>
-            <string>{label}</string>
-            <key>ProgramArguments</key>
-            <array>
-                <string>{distro_bin}</string>
-                <string>watchdog</string>
-                <string>--supervised</string>
-                <string>--host</string>
-                <string>{host}</string>
-                <string>--port</string>
-                <string>{port}</string>
-            </array>
-            <key>RunAtLoad</key>
-            <true/>
-            <key>KeepAlive</key>
-            <true/>
-            <key>WorkingDirectory</key>
-            <string>{home}</string>
-            <key>StandardOutPath</key>
-            <string>{srv_dir}/watchdog-launchd-stdout.log</string>
-            <key>StandardErrorPath</key>
-            <string>{srv_dir}/watchdog-launchd-stderr.log</string>
-            <key>EnvironmentVariables</key>
-            <dict>
-                <key>PATH</key>
-                <string>{path_env}</string>
-            </dict>
-        </dict>
-        </plist>
-    """)
+    return _LAUNCHD_WATCHDOG_PLIST.substitute(
+        label=label,
+        distro_bin=distro_bin,
+        host=host,
+        port=port,
+        home=home,
+        srv_dir=srv_dir,
+        path_env=path_env,
+    )
 
 
 def _install_launchd(
@@ -769,10 +841,21 @@ def _status_launchd() -> ServiceResult:
     details: list[str] = []
     label = conventions.LAUNCHD_LABEL
 
-    # Check server
     server_plist = _launchd_server_plist_path()
-    if server_plist.exists():
-        ok, _output = _run_cmd(["launchctl", "list", label])
+    watchdog_plist = _launchd_watchdog_plist_path()
+    server_installed = server_plist.exists()
+    watchdog_installed = watchdog_plist.exists()
+
+    probes: list[list[str]] = []
+    if server_installed:
+        probes.append(["launchctl", "list", label])
+    if watchdog_installed:
+        probes.append(["launchctl", "list", f"{label}.watchdog"])
+    results = iter(_run_cmds_concurrently(probes))
+
+    # Check server
+    if server_installed:
+        ok, _output = next(results)
         if ok:
             details.append("Server agent: installed (loaded)")
         else:
@@ -794,9 +877,8 @@ def _status_launchd() -> ServiceResult:
         details.append("Server agent: not installed")
 
     # Check watchdog
-    watchdog_plist = _launchd_watchdog_plist_path()
-    if watchdog_plist.exists():
-        ok, _output = _run_cmd(["launchctl", "list", f"{label}.watchdog"])
+    if watchdog_installed:
+        ok, _output = next(results)
         if ok:
             details.append("Watchdog agent: installed (loaded)")
         else:
@@ -804,7 +886,7 @@ def _status_launchd() -> ServiceResult:
     else:
         details.append("Watchdog agent: not installed")
 
-    installed = server_plist.exists() or watchdog_plist.exists()
+    installed = server_installed or watchdog_installed
     return ServiceResult(
         success=True,
         platform="macos",
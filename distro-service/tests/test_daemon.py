@@ -5,9 +5,12 @@ from __future__ import annotations
 import socket
 from pathlib import Path
 
+import pytest
+
 from amplifier_distro.server.daemon import (
     check_port,
     is_running,
+    pid_alive,
     read_pid,
     remove_pid,
     write_pid,
@@ -46,6 +49,16 @@ class TestIsRunning:
         assert is_running(pid_file) is False
 
 
+class TestPidAlive:
+    def test_true_for_current_process(self) -> None:
+        import os
+
+        assert pid_alive(os.getpid()) is True
+
+    def test_false_for_dead_process(self) -> None:
+        assert pid_alive(99999999) is False
+
+
 class TestWritePid:
     def test_writes_current_pid(self, tmp_path: Path) -> None:
         import os
@@ -95,3 +108,29 @@ class TestCheckPort:
             s.listen(1)
             # Port is occupied — check_port should return False
             assert check_port("127.0.0.1", held_port) is False
+
+    @pytest.mark.skipif(not socket.has_ipv6, reason="IPv6 not supported")
+    def test_ipv6_loopback_uses_ipv6_family(self) -> None:
+        try:
+            with socket.socket(socket.AF_INET6, socket.SOCK_STREAM) as s:
+                s.bind(("::1", 0))
+                free_port = s.getsockname()[1]
+        except OSError:
+            pytest.skip("IPv6 loopback not available")
+        assert check_port("::1", free_port) is True
+
+    def test_localhost_probes_ipv4_like_the_server(self) -> None:
+        # uvicorn binds hostnames over IPv4, even where localhost resolves
+        # to ::1 first, so an occupied 127.0.0.1 port must be reported busy.
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            s.bind(("127.0.0.1", 0))
+            _, held_port = s.getsockname()
+            s.listen(1)
+            assert check_port("localhost", held_port) is False
+
+    def test_localhost_available_port_returns_true(self) -> None:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.bind(("127.0.0.1", 0))
+            _, free_port = s.getsockname()
+        assert check_port("localhost", free_port) is True
@@ -16,6 +16,7 @@ from amplifier_distro.service import (
     _status_launchd,
     _status_systemd,
     _systemd_server_unit_path,
+    _uninstall_systemd,
 )
 
 
@@ -60,6 +61,16 @@ class TestLaunchdServerPlist:
         assert "<string>--port</string>" in plist
         assert "<string>8410</string>" in plist
 
+    def test_launchd_plist_server_dir_follows_home_set_after_import(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """Log paths use the server dir resolved at generation time."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        plist = _generate_launchd_server_plist(
+            "/usr/local/bin/amp-distro", "0.0.0.0", 8410
+        )
+        assert f"{tmp_path}/.amplifier/" in plist
+
 
 class TestServiceInstallCLI:
     """Tests for the service install CLI command.
@@ -167,6 +178,14 @@ class TestSystemdServerUnitGeneration:
         assert "EnvironmentFile=-" in unit
         assert ".amplifier/.env" in unit
 
+    def test_amplifier_home_follows_home_set_after_import(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """The unit embeds the Amplifier home resolved at generation time."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        unit = _generate_systemd_server_unit("/usr/bin/amp-distro", "127.0.0.1", 8410)
+        assert f"EnvironmentFile=-{tmp_path}/.amplifier/.env" in unit
+
 
 class TestSystemdWatchdogUnitGeneration:
     """Tests for the systemd watchdog unit generator.
@@ -302,3 +321,75 @@ class TestStaleServeDetection:
         finally:
             if plist_path.exists():
                 plist_path.unlink()
+
+
+class TestStatusProbes:
+    """Status probes run concurrently but report in a stable order."""
+
+    def test_systemd_status_reports_each_unit_state(self, tmp_path) -> None:
+        (tmp_path / "amplifier-distro.service").write_text("[Service]\n")
+        (tmp_path / "amplifier-distro-watchdog.service").write_text("[Service]\n")
+
+        def fake_run(cmd: list[str]) -> tuple[bool, str]:
+            if cmd[-1].endswith("-watchdog.service"):
+                return False, "inactive"
+            return True, "active"
+
+        with (
+            patch("amplifier_distro.service._systemd_dir", return_value=tmp_path),
+            patch("amplifier_distro.service._run_cmd", side_effect=fake_run),
+        ):
+            result = _status_systemd()
+
+        assert result.details[0] == "Server service: installed (active)"
+        assert result.details[-1] == "Watchdog service: installed (inactive)"
+
+
+class TestSystemdUninstall:
+    """Both units are stopped and disabled with a single systemctl call."""
+
+    def test_disables_both_units_in_one_call(self, tmp_path) -> None:
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str]) -> tuple[bool, str]:
+            calls.append(cmd)
+            return True, ""
+
+        with (
+            patch("amplifier_distro.service._systemd_dir", return_value=tmp_path),
+            patch("amplifier_distro.service._run_cmd", side_effect=fake_run),
+        ):
+            result = _uninstall_systemd()
+
+        assert result.success
+        assert calls[0] == [
+            "systemctl",
+            "--user",
+            "disable",
+            "--now",
+            "amplifier-distro-watchdog.service",
+            "amplifier-distro.service",
+        ]
+        assert calls[1:] == [["systemctl", "--user", "daemon-reload"]]
+
+    def test_falls_back_to_per_unit_calls_when_batch_fails(self, tmp_path) -> None:
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str]) -> tuple[bool, str]:
+            calls.append(cmd)
+            return "--now" not in cmd, ""
+
+        with (
+            patch("amplifier_distro.service._systemd_dir", return_value=tmp_path),
+            patch("amplifier_distro.service._run_cmd", side_effect=fake_run),
+        ):
+            result = _uninstall_systemd()
+
+        assert result.success
+        per_unit = [cmd[2:] for cmd in calls[1:-1]]
+        assert per_unit == [
+            ["stop", "amplifier-distro-watchdog.service"],
+            ["disable", "amplifier-distro-watchdog.service"],
+            ["stop", "amplifier-distro.service"],
+            ["disable", "amplifier-distro.service"],
+        ]